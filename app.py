@@ -1,705 +1,1426 @@
-"""
-Application principale pour l'analyse de décomposition sociale
-Auteur: Équipe IFORD Groupe 4, Lab_Math and SCSM Group & CIE
-Version: 1.0.0 - Copyright 2026
-"""
-
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from pathlib import Path
-import sys
-import os
-from datetime import datetime
-
-# Ajouter le dossier modules au path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
-
-# Configuration de la page Streamlit (DOIT ÊTRE LA PREMIÈRE COMMANDE STREAMLIT)
-st.set_page_config(
-    page_title="Analyse de Décomposition Sociale",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded",
-    menu_items={
-        'Get Help': 'https://github.com/iford/decomposition-app',
-        'Report a bug': 'https://github.com/iford/decomposition-app/issues',
-        'About': "Application d'analyse de décomposition sociale - IFORD Groupe 4"
-    }
-)
-
-# Importer les modules (avec gestion d'erreur silencieuse pour la prod)
-try:
-    from modules.demographic import DemographicDecomposition
-    from modules.mathematical import MathematicalDecomposition
-    from modules.regression import RegressionDecomposition
-    from modules.structural import StructuralDecomposition
-    from modules.utils import DataLoader, Validator, Exporter
-    from visualization.charts import create_decomposition_charts, create_time_series_chart
-    from visualization.tables import TableGenerator
-    from visualization.reports import ReportGenerator, ExcelExporter
-except ImportError:
-    # Classes factices minimales pour éviter le crash si modules manquants
-    class DemographicDecomposition:
-        def analyze(self, *args, **kwargs): return {"error": "Module non disponible"}
-    class MathematicalDecomposition: pass
-    class RegressionDecomposition: pass
-    class StructuralDecomposition: pass
-    class TableGenerator:
-        @staticmethod
-        def create_detailed_table(*args, **kwargs): return go.Figure()
-    class ReportGenerator: pass
-
-# ============================================================================
-# STYLES CSS PERSONNALISÉS
-# ============================================================================
-st.markdown("""
-<style>
-    /* En-tête principal */
-    .main-header {
-        font-size: 2.5rem;
-        color: #1E3A8A;
-        text-align: center;
-        margin-bottom: 2rem;
-        padding: 1rem;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 10px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Sous-titres */
-    .sub-header {
-        font-size: 1.8rem;
-        color: #3B82F6;
-        margin-top: 1.5rem;
-        margin-bottom: 1rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 3px solid #3B82F6;
-    }
-    
-    /* Boîtes d'information */
-    .info-box {
-        background-color: #DBEAFE;
-        padding: 1.5rem;
-        border-radius: 0.8rem;
-        border-left: 5px solid #3B82F6;
-        margin: 1.2rem 0;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-    
-    .success-box {
-        background-color: #D1FAE5;
-        padding: 1.2rem;
-        border-radius: 0.6rem;
-        border-left: 4px solid #10B981;
-        margin: 1rem 0;
-    }
-    
-    .warning-box {
-        background-color: #FEF3C7;
-        padding: 1.2rem;
-        border-radius: 0.6rem;
-        border-left: 4px solid #F59E0B;
-        margin: 1rem 0;
-    }
-    
-    .formula-box {
-        font-family: "Courier New", monospace;
-        background-color: #F3F4F6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.8rem 0;
-        border: 1px solid #D1D5DB;
-        font-size: 0.9rem;
-    }
-    
-    /* Footer Style Spécifique - C'est ici que la magie opère pour le footer */
-    .footer-container {
-        text-align: center;
-        margin-top: 3rem;
-        padding: 2rem;
-        background-color: #F9FAFB;
-        border-top: 1px solid #E5E7EB;
-        border-radius: 10px;
-        font-family: sans-serif;
-    }
-    .footer-title {
-        color: #1E3A8A;
-        font-size: 1.1rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    .footer-copyright {
-        color: #6B7280;
-        font-size: 0.9rem;
-        margin-bottom: 1rem;
-    }
-    .footer-links {
-        color: #9CA3AF;
-        font-size: 0.9rem;
-        margin: 1rem 0;
-        padding-top: 1rem;
-        border-top: 1px solid #E5E7EB;
-        display: flex;
-        justify-content: center;
-        gap: 15px;
-        flex-wrap: wrap;
-    }
-    .footer-item {
-        display: inline-block;
-    }
-    .footer-credits {
-        color: #9CA3AF;
-        font-size: 0.8rem;
-        margin-top: 1rem;
-        line-height: 1.5;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# ============================================================================
-# INITIALISATION DE SESSION STATE
-# ============================================================================
-if 'current_data' not in st.session_state:
-    st.session_state.current_data = None
-if 'results' not in st.session_state:
-    st.session_state.results = {}
-if 'analysis_type' not in st.session_state:
-    st.session_state.analysis_type = None
-if 'file_uploaded' not in st.session_state:
-    st.session_state.file_uploaded = False
-if 'use_example' not in st.session_state:
-    st.session_state.use_example = False
-if 'analysis_history' not in st.session_state:
-    st.session_state.analysis_history = []
-
-# ============================================================================
-# FONCTIONS UTILITAIRES
-# ============================================================================
-def reset_application():
-    """Réinitialise complètement l'application"""
-    st.session_state.current_data = None
-    st.session_state.results = {}
-    st.session_state.analysis_type = None
-    st.session_state.file_uploaded = False
-    st.session_state.use_example = False
-    st.rerun()
-
-def load_example_data(example_name):
-    """Charge un jeu de données d'exemple"""
-    try:
-        if example_name == "Afrique: Dépenses éducation (2015-2020)":
-            data = {
-                'Pays': ['Algérie', 'Angola', 'Bénin', 'Botswana', 'Burkina Faso'],
-                'w_2015': [3.2969, 2.3451, 0.9115, 0.1922, 1.5606],
-                'y_2015': [3.2804, 1.5274, 2.7579, 9.6725, 4.1548],
-                'w_2020': [3.1978, 2.4601, 0.9305, 0.1874, 1.5839],
-                'y_2020': [4.0239, 3.9343, 3.3283, 10.1181, 4.8370]
-            }
-            df = pd.DataFrame(data)
-        elif example_name == "USA: Opinion présidentielle (1972-2010)":
-            data = {
-                'Niveau_éducation': ['Sans diplôme', 'Secondaire', 'Université incomplète', 'Bachelor', 'Master+'],
-                'w_1972': [40.705, 46.923, 1.090, 7.949, 3.333],
-                'y_1972': [69, 75, 71, 84, 89],
-                'w_2010': [14.922, 48.973, 7.094, 18.346, 10.665],
-                'y_2010': [93, 96, 99, 98, 100]
-            }
-            df = pd.DataFrame(data)
-        else:  # Écarts salariaux H/F
-            np.random.seed(42)
-            n = 200
-            df = pd.DataFrame({
-                'genre': np.random.choice(['Homme', 'Femme'], n, p=[0.6, 0.4]),
-                'education': np.random.normal(12, 3, n).clip(0, 20),
-                'experience': np.random.exponential(10, n).clip(0, 40),
-                'salaire': 30000 + 5000*(np.random.choice(['Homme', 'Femme'], n, p=[0.6, 0.4])=='Homme') + 2000*np.random.normal(12, 3, n).clip(0, 20) + 800*np.random.exponential(10, n).clip(0, 40) + np.random.normal(0, 3000, n)
-            })
-        
-        st.session_state.current_data = df
-        st.session_state.use_example = True
-        return df
-    except Exception as e:
-        st.error(f"Erreur lors du chargement de l'exemple: {str(e)}")
-        return None
-
-def save_to_history(analysis_type, results):
-    """Sauvegarde une analyse dans l'historique"""
-    history_entry = {
-        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        'type': analysis_type,
-        'summary': {
-            'total_change': results.get('aggregate_results', {}).get('total_change', 0) if isinstance(results, dict) else 0,
-            'composition_percent': results.get('aggregate_results', {}).get('composition_percent', 0) if isinstance(results, dict) else 0,
-            'behavior_percent': results.get('aggregate_results', {}).get('behavior_percent', 0) if isinstance(results, dict) else 0
-        }
-    }
-    st.session_state.analysis_history.append(history_entry)
-    if len(st.session_state.analysis_history) > 10:
-        st.session_state.analysis_history = st.session_state.analysis_history[-10:]
-
-# ============================================================================
-# HEADER PRINCIPAL
-# ============================================================================
-st.markdown('<h1 class="main-header fade-in">📊 APPLICATION D\'ANALYSE DE DÉCOMPOSITION SOCIALE</h1>', unsafe_allow_html=True)
-
-st.markdown("""
-<div class="info-box fade-in">
-    <strong>🚀 Transformez vos nuits blanches de calculs Excel en analyses rigoureuses en quelques clics</strong><br><br>
-    Cet outil implémente les méthodes de décomposition pour l'étude du changement social selon le manuel IFORD.
-    Identifiez les sources du changement social (effets de composition vs comportement) de manière simple et rigoureuse.
-</div>
-""", unsafe_allow_html=True)
-
-# ============================================================================
-# SIDEBAR - NAVIGATION ET CONFIGURATION
-# ============================================================================
-with st.sidebar:
-    # Logo et titre
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        st.image("https://cdn-icons-png.flaticon.com/512/1995/1995515.png", width=60)
-    with col2:
-        st.markdown("### 🔍 Navigation")
-    
-    st.markdown("---")
-    
-    # Sélection du type d'analyse
-    analysis_type = st.radio(
-        "**CHOISISSEZ LE TYPE D'ANALYSE :**",
-        [
-            "🏠 Accueil et Guide",
-            "👥 Décomposition Démographique", 
-            "➗ Décomposition Mathématique",
-            "📈 Décomposition de Régression", 
-            "🏗️ Décomposition Structurelle",
-            "📚 Documentation et Exemples"
-        ],
-        key="nav_analysis_type"
-    )
-    
-    st.markdown("---")
-    
-    # Section de chargement de données
-    st.markdown("### 📁 CHARGEMENT DES DONNÉES")
-    
-    uploaded_file = st.file_uploader(
-        "Importer vos données :",
-        type=['csv', 'xlsx', 'xls'],
-        help="Formats acceptés: CSV, Excel (xlsx, xls)",
-        key="file_uploader"
-    )
-    
-    if uploaded_file is not None:
-        try:
-            if uploaded_file.name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file)
-            else:
-                df = pd.read_excel(uploaded_file)
-            
-            st.session_state.current_data = df
-            st.session_state.file_uploaded = True
-            
-            st.success(f"✅ Fichier chargé : {uploaded_file.name}")
-            st.info(f"Dimensions : {df.shape[0]} lignes × {df.shape[1]} colonnes")
-            
-            with st.expander("👁️ Aperçu rapide"):
-                st.dataframe(df.head(), use_container_width=True)
-                
-        except Exception as e:
-            st.error(f"❌ Erreur de chargement : {str(e)}")
-    
-    # Boutons d'action rapide
-    st.markdown("### ⚡ ACTIONS RAPIDES")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("📋 Exemples", use_container_width=True):
-            st.session_state.use_example = True
-    with col2:
-        if st.button("🔄 Réinitialiser", use_container_width=True):
-            reset_application()
-    
-    # Informations sur les données actuelles
-    if st.session_state.current_data is not None:
-        st.markdown("---")
-        st.markdown("### 📊 DONNÉES CHARGÉES")
-        df_info = st.session_state.current_data
-        st.metric("Lignes", df_info.shape[0])
-        st.metric("Colonnes", df_info.shape[1])
-        st.caption(f"Colonnes : {', '.join(df_info.columns.tolist()[:5])}{'...' if len(df_info.columns) > 5 else ''}")
-    
-    st.markdown("---")
-    
-    # Pied de page de la sidebar
-    st.markdown("""
-    <div style="text-align: center; color: #666; font-size: 0.8rem; padding: 1rem;">
-    <strong>Power by Lab_Math and SCSM Group & CIE.</strong><br>
-    Copyright 2026, tous droits réservés.<br>
-    Version 1.0.0
-    </div>
-    """, unsafe_allow_html=True)
-
-# ============================================================================
-# PAGE D'ACCUEIL
-# ============================================================================
-if analysis_type == "🏠 Accueil et Guide":
-    st.markdown('<h2 class="sub-header">🏠 Bienvenue dans l\'outil d\'analyse de décomposition</h2>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.markdown("""
-        ### 📋 Qu'est-ce que la décomposition ?
-        
-        La **décomposition** est une méthode statistique qui permet de comprendre **les sources d'un changement social** en séparant les effets de **composition** et de **comportement**.
-        
-        ### 🎯 Pourquoi utiliser cette application ?
-        
-        1. **Simplifier** les analyses complexes de décomposition
-        2. **Automatiser** les calculs fastidieux
-        3. **Visualiser** les résultats de manière intuitive
-        4. **Documenter** les analyses de manière professionnelle
-        5. **Réduire les erreurs** de calcul manuel
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 🚀 Démarrage rapide
-        
-        1. **Sélectionnez** un type d'analyse
-        2. **Chargez** vos données
-        3. **Configurez** les paramètres
-        4. **Visualisez** les résultats
-        5. **Exportez** votre rapport
-        """)
-    
-    st.markdown("---")
-    
-    st.markdown('<h3 class="sub-header">📊 Types d\'analyse disponibles</h3>', unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        with st.container(border=True):
-            st.markdown("### 👥 Démographique")
-            st.markdown("""
-            **Effets composition/comportement**
-            
-            ΔY = Σ(ȳⱼΔwⱼ) + Σ(ẇⱼΔyⱼ)
-            
-            *Par groupes, régions, etc.*
-            """)
-    
-    with col2:
-        with st.container(border=True):
-            st.markdown("### ➗ Mathématique")
-            st.markdown("""
-            **Formules exactes**
-            
-            Δ(Y/Z) = (1/Ƶ)ΔY - (Ȳ/Ƶ²)ΔZ
-            
-            *Ratios, produits, etc.*
-            """)
-    
-    with col3:
-        with st.container(border=True):
-            st.markdown("### 📈 Régression")
-            st.markdown("""
-            **Oaxaca-Blinder**
-            
-            ΔY = Δα + β̄ΔX + X̄Δβ
-            
-            *Écarts entre groupes*
-            """)
-    
-    with col4:
-        with st.container(border=True):
-            st.markdown("### 🏗️ Structurelle")
-            st.markdown("""
-            **Analyses complexes**
-            
-            *Multi-niveaux*
-            *Emboîtée*
-            *Cheminement*
-            """)
-    
-    st.markdown("---")
-    
-    if st.session_state.analysis_history:
-        st.markdown('<h3 class="sub-header">📈 Historique des analyses</h3>', unsafe_allow_html=True)
-        
-        history_df = pd.DataFrame(st.session_state.analysis_history)
-        st.dataframe(
-            history_df,
-            column_config={
-                "timestamp": "Date/Heure",
-                "type": "Type d'analyse",
-                "summary.total_change": st.column_config.NumberColumn("Δ Total", format="%.4f"),
-                "summary.composition_percent": st.column_config.NumberColumn("% Composition", format="%.1f%%"),
-                "summary.behavior_percent": st.column_config.NumberColumn("% Comportement", format="%.1f%%")
-            },
-            use_container_width=True
-        )
-    
-    st.markdown("---")
-    st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-    st.markdown("""
-    **💡 Conseil pédagogique :** Commencez par un exemple pour comprendre la logique avant d'importer vos propres données.
-    
-    **👉 Sélectionnez un type d'analyse dans le menu de gauche pour commencer !**
-    """)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-# ============================================================================
-# MODULE DÉCOMPOSITION DÉMOGRAPHIQUE
-# ============================================================================
-elif analysis_type == "👥 Décomposition Démographique":
-    st.markdown('<h2 class="sub-header">👥 Décomposition Démographique</h2>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([3, 2])
-    with col1:
-        st.markdown("""
-        <div class="info-box">
-        <strong>Définition :</strong> Cette méthode décompose un changement observé au niveau agrégé en deux effets :<br><br>
-        1. <strong>Effet de composition</strong> : changement dû aux variations dans la répartition des groupes<br>
-        2. <strong>Effet de comportement</strong> : changement dû aux variations dans les comportements moyens des groupes
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="formula-box">
-        <strong>Formule de base (Kitagawa, 1955) :</strong><br><br>
-        ΔY = Σ[(y₂ᵢ + y₁ᵢ)/2 × (w₂ᵢ - w₁ᵢ)] + Σ[(w₂ᵢ + w₁ᵢ)/2 × (y₂ᵢ - y₁ᵢ)]<br><br>
-        <em>où :<br>
-        • y = variable d'intérêt<br>
-        • w = poids du groupe<br>
-        • indices 1 et 2 = périodes</em>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    st.markdown('<h3 class="sub-header">📥 Données d\'entrée</h3>', unsafe_allow_html=True)
-    
-    data_option = st.radio(
-        "Source des données :",
-        ["📤 Importer un fichier", "📋 Utiliser un exemple", "✍️ Saisie manuelle"],
-        horizontal=True,
-        key="demographic_data_option"
-    )
-    
-    if data_option == "📤 Importer un fichier":
-        if st.session_state.current_data is not None:
-            df = st.session_state.current_data
-            with st.expander("🔍 Visualisation des données", expanded=True):
-                st.dataframe(df, use_container_width=True)
-                st.markdown("**Statistiques descriptives :**")
-                st.dataframe(df.describe(), use_container_width=True)
-        else:
-            st.warning("⚠️ Aucun fichier chargé. Utilisez l'importeur dans la sidebar.")
-    
-    elif data_option == "📋 Utiliser un exemple":
-        example_choice = st.selectbox(
-            "Choisir un exemple :",
-            [
-                "Afrique: Dépenses éducation (2015-2020)", 
-                "USA: Opinion présidentielle féminine (1972-2010)",
-                "Cameroun: Mortalité infantile (1991-2011)"
-            ],
-            key="demographic_example"
-        )
-        
-        if st.button("📥 Charger cet exemple", type="primary"):
-            with st.spinner("Chargement de l'exemple..."):
-                df = load_example_data(example_choice)
-                if df is not None:
-                    st.session_state.current_data = df
-                    st.success(f"✅ Exemple '{example_choice}' chargé avec succès!")
-                    st.dataframe(df, use_container_width=True)
-    
-    else:  # Saisie manuelle
-        st.info("💡 Créez votre propre ensemble de données")
-        num_groups = st.number_input("Nombre de groupes :", min_value=2, max_value=20, value=5, step=1)
-        if st.button("📝 Créer le tableau de saisie", type="secondary"):
-            st.session_state.manual_data_ready = True
-        
-        if st.session_state.get('manual_data_ready', False):
-            manual_data = []
-            st.markdown("**Saisie des données par groupe :**")
-            for i in range(num_groups):
-                cols = st.columns(5)
-                with cols[0]:
-                    group_name = st.text_input(f"Nom groupe {i+1}", value=f"Groupe {i+1}", key=f"group_{i}")
-                with cols[1]:
-                    w1 = st.number_input(f"w₁ {i+1}", value=20.0, min_value=0.0, key=f"w1_{i}")
-                with cols[2]:
-                    y1 = st.number_input(f"y₁ {i+1}", value=50.0, key=f"y1_{i}")
-                with cols[3]:
-                    w2 = st.number_input(f"w₂ {i+1}", value=25.0, min_value=0.0, key=f"w2_{i}")
-                with cols[4]:
-                    y2 = st.number_input(f"y₂ {i+1}", value=60.0, key=f"y2_{i}")
-                manual_data.append([group_name, w1, y1, w2, y2])
-            
-            if st.button("✅ Valider la saisie manuelle"):
-                df = pd.DataFrame(manual_data, columns=['Groupe', 'w_2015', 'y_2015', 'w_2020', 'y_2020'])
-                st.session_state.current_data = df
-                st.success("Données manuelles validées!")
-    
-    if st.session_state.current_data is not None:
-        st.markdown("---")
-        st.markdown('<h3 class="sub-header">⚙️ Configuration de l\'analyse</h3>', unsafe_allow_html=True)
-        
-        df = st.session_state.current_data
-        col_names = list(df.columns)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown("**Variables de groupe :**")
-            group_col = st.selectbox("Colonne des groupes :", col_names, index=0)
-            period_names = st.text_input("Noms des périodes :", value="2015, 2020")
-        
-        with col2:
-            st.markdown("**Variables période 1 :**")
-            w1_col = st.selectbox("w₁ (poids) :", col_names, index=1 if len(col_names) > 1 else 0)
-            y1_col = st.selectbox("y₁ (valeur) :", col_names, index=2 if len(col_names) > 2 else 0)
-        
-        with col3:
-            st.markdown("**Variables période 2 :**")
-            w2_col = st.selectbox("w₂ (poids) :", col_names, index=3 if len(col_names) > 3 else 0)
-            y2_col = st.selectbox("y₂ (valeur) :", col_names, index=4 if len(col_names) > 4 else 0)
-        
-        st.markdown("**Options d'analyse :**")
-        col_opt1, col_opt2, col_opt3 = st.columns(3)
-        with col_opt1:
-            normalize = st.checkbox("Normaliser les poids à 100%", value=True)
-        with col_opt2:
-            confidence_level = st.slider("Niveau de confiance :", 0.90, 0.99, 0.95, 0.01)
-        with col_opt3:
-            decimal_places = st.selectbox("Décimales :", [2, 3, 4, 5], index=2)
-        
-        if st.button("🚀 Lancer l'analyse démographique", type="primary", use_container_width=True):
-            with st.spinner("🔍 Analyse en cours..."):
-                try:
-                    # Simulation des résultats pour l'affichage (car les modules peuvent ne pas être présents)
-                    results = {
-                        'group_results': df.copy(),
-                        'aggregate_results': {
-                            'total_change': 10.5,
-                            'composition_effect': 3.2,
-                            'behavior_effect': 7.3,
-                            'composition_percent': 30.5,
-                            'behavior_percent': 69.5,
-                            'Y1': 50.0,
-                            'Y2': 60.5,
-                            'verification': 0.0
-                        }
-                    }
-                    # Ajout de colonnes simulées pour l'exemple
-                    results['group_results']['total_contribution'] = np.random.uniform(-5, 5, len(df))
-                    results['group_results']['contribution_percent'] = np.random.uniform(0, 100, len(df))
-                    results['group_results']['group'] = df[group_col]
-                    results['group_results']['y1'] = df[y1_col]
-                    results['group_results']['y2'] = df[y2_col]
-                    results['group_results']['contribution_abs'] = abs(results['group_results']['total_contribution'])
-
-                    st.session_state.results = results
-                    st.session_state.analysis_type = "demographic"
-                    save_to_history("demographic", results)
-                    
-                    st.success("✅ Analyse terminée avec succès!")
-                except Exception as e:
-                    st.error(f"❌ Erreur lors de l'analyse: {str(e)}")
-                    st.info("Vérifiez la sélection de vos colonnes et le format de vos données.")
-
-    # Affichage des résultats
-    if st.session_state.results and st.session_state.analysis_type == "demographic":
-        st.markdown("---")
-        st.markdown('<h2 class="sub-header">📊 Résultats de l\'analyse démographique</h2>', unsafe_allow_html=True)
-        
-        results = st.session_state.results
-        
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "📋 Tableau détaillé", 
-            "📈 Visualisations", 
-            "🎯 Résumé global", 
-            "📝 Interprétation", 
-            "💾 Export"
-        ])
-        
-        with tab1:
-            st.markdown("#### Contributions détaillées par groupe")
-            group_results = results['group_results'].copy()
-            st.dataframe(group_results, use_container_width=True)
-        
-        with tab2:
-            st.markdown("#### Visualisations graphiques")
-            col_viz1, col_viz2 = st.columns(2)
-            with col_viz1:
-                # Simulation graphiques
-                fig1 = go.Figure(data=[go.Bar(x=['A', 'B'], y=[10, 20])])
-                st.plotly_chart(fig1, use_container_width=True)
-            with col_viz2:
-                fig2 = px.pie(values=[30, 70], names=['Composition', 'Comportement'])
-                st.plotly_chart(fig2, use_container_width=True)
-                
-        with tab3:
-            st.markdown("#### Résumé global de l'analyse")
-            agg = results['aggregate_results']
-            col_met1, col_met2, col_met3 = st.columns(3)
-            with col_met1:
-                st.metric("Changement total (ΔY)", f"{agg['total_change']:.2f}")
-            with col_met2:
-                st.metric("Effet de composition", f"{agg['composition_effect']:.2f}", delta=f"{agg['composition_percent']:.1f}%")
-            with col_met3:
-                st.metric("Effet de comportement", f"{agg['behavior_effect']:.2f}", delta=f"{agg['behavior_percent']:.1f}%")
-
-        with tab4:
-            st.markdown("#### Interprétation des résultats")
-            st.info("L'interprétation automatique se base sur les seuils standards (70%/30%).")
-            
-        with tab5:
-            st.markdown("#### Options d'export")
-            st.button("📥 Générer le fichier Excel")
-
-# ============================================================================
-# AUTRES MODULES (PLACEHOLDERS POUR LA DÉMO)
-# ============================================================================
-elif analysis_type in ["➗ Décomposition Mathématique", "📈 Décomposition de Régression", "🏗️ Décomposition Structurelle"]:
-    st.markdown(f'<h2 class="sub-header">{analysis_type}</h2>', unsafe_allow_html=True)
-    st.info("Ce module fonctionne de manière similaire. Veuillez charger les données spécifiques à cette méthode.")
-
-elif analysis_type == "📚 Documentation et Exemples":
-    st.markdown('<h2 class="sub-header">📚 Documentation et Exemples</h2>', unsafe_allow_html=True)
-    st.markdown("Documentation complète disponible dans le manuel utilisateur.")
-
-# ============================================================================
-# FOOTER GLOBAL
-# ============================================================================
-st.markdown("---")
-
-# CORRECTION ICI : Structure HTML propre pour le footer (utilisation de classes CSS définies plus haut)
-st.markdown("""
-<div class="footer-container">
-    <div class="footer-title">Power by Lab_Math and SCSM Group & CIE.</div>
-    <div class="footer-copyright">Copyright 2026, tous droits réservés.</div>
-    <div class="footer-item">📧 Contact : info@labmath-scsm.com.</div>
-    <div class="footer-item">🌐 Site : www.labmath-scsm.com.</div>
-    <div class="footer-item">📱 Support : +237 620 307 439.</div>
-    <div class="footer-credits">Application d'Analyse de Décomposition Sociale - Version 1.0.0<br>
-                                Dernière mise à jour : Novembre 2026<br>
-                                Développé par l'Équipe de Lab_Math et SCSM Group & CIE.</div>
-    
-</div>
-""", unsafe_allow_html=True)
-
-# Animation ballons si première visite
-if 'show_welcome' not in st.session_state:
-    st.session_state.show_welcome = True
-
-if st.session_state.show_welcome:
-    with st.sidebar:
+"""
+Application principale pour l'analyse de décomposition sociale
+Auteur: Équipe IFORD Groupe 4, Lab_Math and SCSM Group & CIE
+Version: 1.0.0 - Copyright 2026
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import io
+from collections import Counter
+from datetime import datetime
+
+# Configuration de la page Streamlit (DOIT ÊTRE LA PREMIÈRE COMMANDE STREAMLIT)
+st.set_page_config(
+    page_title="Analyse de Décomposition Sociale",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded",
+    menu_items={
+        'Get Help': 'https://github.com/iford/decomposition-app',
+        'Report a bug': 'https://github.com/iford/decomposition-app/issues',
+        'About': "Application d'analyse de décomposition sociale - IFORD Groupe 4"
+    }
+)
+
+# Jeux de données d'exemple (construits à la demande, puis mis en cache)
+from modules.examples import EXAMPLE_BUILDERS, DEFAULT_EXAMPLE, STRUCTURAL_EXAMPLE
+
+# ============================================================================
+# STYLES CSS PERSONNALISÉS
+# ============================================================================
+# Le thème de base (couleurs, police) est défini dans .streamlit/config.toml ;
+# les encadrés et sous-titres utilisent les composants natifs de Streamlit.
+# Seul l'en-tête principal reste en HTML : son style est réémis avec lui à
+# chaque exécution, Streamlit retirant les éléments non redessinés.
+_CSS = """
+<style>
+    /* En-tête principal */
+    .main-header {
+        font-size: 2.5rem;
+        color: #1E3A8A;
+        text-align: center;
+        margin-bottom: 2rem;
+        padding: 1rem;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border-radius: 10px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+</style>
+"""
+
+# ============================================================================
+# TEXTES STATIQUES
+# ============================================================================
+# Encadrés et pages de documentation : constantes de module passées telles
+# quelles aux éléments Streamlit
+_KITAGAWA_FORMULA_MD = """
+**Formule de base (Kitagawa, 1955) :**
+```
+ΔY = Σ[(y₂ᵢ + y₁ᵢ)/2 × (w₂ᵢ - w₁ᵢ)] + Σ[(w₂ᵢ + w₁ᵢ)/2 × (y₂ᵢ - y₁ᵢ)]
+```
+*où :*
+- *y = variable d'intérêt*
+- *w = poids du groupe*
+- *indices 1 et 2 = périodes*
+"""
+
+_STRUCT_INFO_MD = """
+**Décomposition emboîtée :** le changement de la variable d'intérêt est décomposé
+(Kitagawa) selon un groupe principal, puis selon des groupes secondaires
+au sein de chaque catégorie du groupe principal.
+"""
+
+_SIDEBAR_FOOTER_MD = """
+**Power by Lab_Math and SCSM Group & CIE.**  
+Copyright 2026, tous droits réservés.  
+Version 1.0.0
+"""
+
+_FOOTER_MD = """
+Application d'Analyse de Décomposition Sociale - Version 1.0.0  
+Dernière mise à jour : Novembre 2026  
+Développé par l'Équipe de Lab_Math et SCSM Group & CIE.
+"""
+
+# Onglets de la page Documentation : (titre, contenu)
+_DOC_TABS = (
+    ("👥 Démographique", """
+**Données attendues :** une ligne par groupe, avec le poids (w) et la valeur (y)
+de chaque groupe aux deux périodes.
+
+Le changement agrégé ΔY est la somme d'un effet de **composition** (Σ ȳΔw)
+et d'un effet de **comportement** (Σ w̄Δy).
+"""),
+    ("➗ Mathématique", """
+**Données attendues :** la valeur de chaque variable de la formule aux deux périodes.
+
+Chaque effet est la dérivée partielle de Y, évaluée aux valeurs moyennes,
+multipliée par la variation de la variable.
+"""),
+    ("📈 Régression", """
+**Données attendues :** des données individuelles avec une variable dépendante,
+des variables explicatives numériques et une variable de groupe.
+
+L'écart entre les deux groupes est décomposé (Oaxaca-Blinder) en une partie
+**expliquée** par les caractéristiques et une partie **non expliquée**.
+"""),
+    ("🏗️ Structurelle", """
+**Données attendues :** des données individuelles avec une variable d'intérêt,
+une variable de période, un groupe principal et des groupes secondaires.
+
+La décomposition de Kitagawa est appliquée au groupe principal, puis aux
+groupes secondaires au sein de chaque catégorie du groupe principal.
+"""),
+)
+
+# ============================================================================
+# INITIALISATION DE SESSION STATE
+# ============================================================================
+# Historique : tableau structuré NumPy borné aux HISTORY_SIZE dernières analyses
+HISTORY_SIZE = 10
+_HIST_DTYPE = np.dtype([
+    ('timestamp', 'U19'), ('type', 'U32'),
+    ('total_change', 'f8'), ('composition_percent', 'f8'), ('behavior_percent', 'f8')
+])
+
+# Libellés des méthodes Oaxaca-Blinder (format_func du sélecteur)
+_METHOD_LABELS = {
+    'oaxaca': "Oaxaca (groupe de référence = groupe 1)",
+    'oaxaca_reverse': "Oaxaca inversée (référence = groupe 2)",
+    'cotton': "Cotton (coefficients pondérés)",
+    'neumark': "Neumark (régression groupée)"
+}
+
+_DEFAULTS = {
+    'current_data': None,
+    'data_meta': None,
+    'results': {},
+    'analysis_type': None,
+    'file_uploaded': False,
+    'upload_id': None,
+    'use_example': False,
+    'analysis_history': np.empty(0, dtype=_HIST_DTYPE)
+}
+for key, value in _DEFAULTS.items():
+    st.session_state.setdefault(key, value)
+# Résultats mathématiques par formule : dictionnaire propre à chaque session
+st.session_state.setdefault('results_by_formula', {})
+
+# ============================================================================
+# FONCTIONS UTILITAIRES
+# ============================================================================
+def reset_application():
+    """Réinitialise complètement l'application"""
+    st.session_state.current_data = None
+    st.session_state.data_meta = None
+    st.session_state.results = {}
+    st.session_state.results_by_formula = {}
+    st.session_state.analysis_type = None
+    st.session_state.file_uploaded = False
+    st.session_state.upload_id = None
+    st.session_state.use_example = False
+    st.rerun()
+
+@st.cache_data(show_spinner=False, ttl=None)
+def _build_example(name: str) -> pd.DataFrame:
+    """Construit le DataFrame d'un exemple (mis en cache entre les reruns)"""
+    # st.cache_data renvoie déjà une copie à chaque appel : pas de .copy() ici
+    if name not in EXAMPLE_BUILDERS:
+        raise ValueError(f"Exemple inconnu : {name}")
+    return EXAMPLE_BUILDERS[name]()
+
+@st.cache_resource
+def _get_demographic():
+    """Analyseur démographique partagé, importé à la première utilisation"""
+    try:
+        from modules.demographic import DemographicDecomposition
+    except ImportError:
+        from modules.fallbacks import DemographicDecomposition
+    return DemographicDecomposition()
+
+@st.cache_resource
+def _get_mathematical():
+    """Analyseur mathématique partagé, importé à la première utilisation"""
+    try:
+        from modules.mathematical import MathematicalDecomposition
+    except ImportError:
+        from modules.fallbacks import MathematicalDecomposition
+    return MathematicalDecomposition()
+
+@st.cache_data(show_spinner=False, ttl=None, max_entries=128)
+def _run_math(formula_type: str, payload: tuple, periods: tuple) -> dict:
+    """
+    Décomposition mathématique, mise en cache sur la formule et les valeurs saisies
+    
+    payload : ((variable, valeur période 1, valeur période 2), ...)
+    """
+    data = {var: {periods[0]: v1, periods[1]: v2} for var, v1, v2 in payload}
+    return _get_mathematical().analyze(formula_type, data, periods)
+
+@st.cache_data(show_spinner=False)
+def _formula_guide_md() -> str:
+    """Texte du guide des formules, construit une seule fois"""
+    formulas = getattr(_get_mathematical(), 'formulas', {})
+    return "\n".join(f"- **{f.name}** : `{f.expression}`  \n  {f.decomposition_rule}"
+                     for f in formulas.values())
+
+@st.fragment
+def _formula_guide():
+    """Guide des formules (sidebar), isolé des reruns de la page"""
+    with st.expander("📝 Guide des formules", expanded=False):
+        st.markdown(_formula_guide_md())
+
+@st.cache_resource
+def _get_regression():
+    """Analyseur de régression partagé entre sessions (conserve ses ajustements OLS)"""
+    try:
+        from modules.regression import RegressionDecomposition
+    except ImportError:
+        from modules.fallbacks import RegressionDecomposition
+    return RegressionDecomposition()
+
+@st.cache_data(show_spinner=False)
+def _oaxaca(frame_hash: int, _df: pd.DataFrame, outcome: str, predictors: tuple, group_var: str,
+            group1, group2, method: str) -> dict:
+    """Décomposition Oaxaca-Blinder, mise en cache sur l'empreinte des données et les paramètres"""
+    if method != 'neumark' or pd.api.types.is_numeric_dtype(_df[group_var]):
+        return _get_regression().oaxaca_blinder(
+            df=_df, outcome=outcome, predictors=list(predictors),
+            group_var=group_var, group1=group1, group2=group2, method=method
+        )
+    # Neumark : la variable de groupe entre dans la régression groupée,
+    # elle est donc codée en indicatrice 0/1 puis les libellés sont rétablis
+    col = _df[group_var]
+    coded = _df[col.isin([group1, group2])].assign(**{group_var: (col == group2).astype(np.int8)})
+    results = _get_regression().oaxaca_blinder(
+        df=coded, outcome=outcome, predictors=list(predictors),
+        group_var=group_var, group1=0, group2=1, method=method
+    )
+    results['groups'] = {'group1': group1, 'group2': group2}
+    for key in ('means', 'regression_results'):
+        results[key] = {group1: results[key][0], group2: results[key][1]}
+    return results
+
+@st.cache_resource
+def _get_structural():
+    """Analyseur structurel partagé, importé à la première utilisation"""
+    try:
+        from modules.structural import StructuralDecomposition
+    except ImportError:
+        from modules.fallbacks import StructuralDecomposition
+    return StructuralDecomposition()
+
+@st.cache_data(show_spinner=False)
+def _nested(frame_hash: int, _df: pd.DataFrame, outcome: str, primary_group: str,
+            secondary_groups: tuple, periods: tuple, period_var: str) -> dict:
+    """Décomposition emboîtée, mise en cache sur l'empreinte des données et les paramètres"""
+    # Colonnes de groupe et de période en catégories : les groupby travaillent sur les codes
+    cat_cols = [primary_group, period_var, *secondary_groups]
+    df_opt = _df.astype({col: 'category' for col in cat_cols})
+    return _get_structural().nested_decomposition(
+        df=df_opt, outcome=outcome, primary_group=primary_group,
+        secondary_groups=list(secondary_groups), periods=periods, period_var=period_var
+    )
+
+@st.cache_data(show_spinner=False)
+def _demographic_decomp(initial_pop: float, final_pop: float, f1: float, f2: float,
+                        m1: float, m2: float, mig1: float, mig2: float) -> dict:
+    """
+    Composantes démographiques du changement de population (équation de bilan)
+    
+    Taux pour 1000 sur la période, appliqués à la population moyenne ; l'écart
+    non expliqué par les flux est attribué à la structure par âge.
+    """
+    total_change = final_pop - initial_pop
+    mean_pop = (initial_pop + final_pop) / 2
+    fertility_effect = mean_pop * (f1 + f2) / 2 / 1000
+    mortality_effect = -mean_pop * (m1 + m2) / 2 / 1000
+    migration_effect = mean_pop * (mig1 + mig2) / 2 / 1000
+    age_structure_effect = total_change - fertility_effect - mortality_effect - migration_effect
+    
+    # Pourcentages en une division ; population inchangée : 0 % sans exception
+    effects = np.array([fertility_effect, mortality_effect, migration_effect, age_structure_effect])
+    pcts = np.divide(effects, total_change, out=np.zeros_like(effects), where=total_change != 0) * 100.0
+    return {
+        'type': 'demographic_components',
+        'total_change': total_change,
+        'components': {
+            name: {'effect': effect, 'percent': pct}
+            for name, effect, pct in zip(('fécondité', 'mortalité', 'migration', 'structure par âge'),
+                                         effects.tolist(), pcts.tolist())
+        }
+    }
+
+def _simulate_demographic_results(df, group_col, y1_col, y2_col):
+    """Résultats simulés lorsque le module démographique est indisponible"""
+    rng = np.random.default_rng(0)
+    contrib = rng.uniform(-5, 5, len(df))
+    group_results = df.assign(
+        total_contribution=contrib,
+        contribution_percent=rng.uniform(0, 100, len(df)),
+        group=df[group_col],
+        y1=df[y1_col],
+        y2=df[y2_col],
+        contribution_abs=np.abs(contrib)
+    )
+    sorted_results = group_results.sort_values('total_contribution', ascending=False, kind='stable')
+    return {
+        'group_results': group_results,
+        'group_results_sorted': sorted_results.assign(contribution_percent_str=np.char.add(
+            np.char.mod('%.1f', sorted_results['contribution_percent'].to_numpy()), '%'
+        )),
+        'aggregate_results': {
+            'total_change': 10.5,
+            'composition_effect': 3.2,
+            'behavior_effect': 7.3,
+            'composition_percent': 30.5,
+            'behavior_percent': 69.5,
+            'Y1': 50.0,
+            'Y2': 60.5,
+            'verification': 0.0
+        }
+    }
+
+def set_current_data(df):
+    """Enregistre les données courantes, leurs dimensions et leur empreinte"""
+    st.session_state.current_data = df
+    st.session_state.data_meta = {
+        'rows': df.shape[0],
+        'cols': df.shape[1],
+        'head_cols': [str(c) for c in df.columns[:5]],
+        # Calculée une fois au chargement, réutilisée comme clé des caches
+        'hash': _frame_hash(df)
+    }
+
+def load_example_data(example_name):
+    """Charge un jeu de données d'exemple"""
+    try:
+        df = _build_example(example_name)
+        set_current_data(df)
+        st.session_state.use_example = True
+        return df
+    except Exception as e:
+        st.error(f"Erreur lors du chargement de l'exemple: {str(e)}")
+        return None
+
+@st.cache_data(show_spinner="Lecture du fichier...")
+def _parse_upload(name: str, data: bytes) -> pd.DataFrame:
+    """Lit un fichier importé (mis en cache sur son contenu)"""
+    if name.endswith('.csv'):
+        return pd.read_csv(io.BytesIO(data), engine="pyarrow", dtype_backend="pyarrow")
+    return pd.read_excel(io.BytesIO(data), engine="calamine", dtype_backend="pyarrow")
+
+def _frame_hash(df: pd.DataFrame) -> int:
+    """Empreinte du contenu d'un DataFrame (clé des caches et des éléments)"""
+    return hash((tuple(df.columns), int(pd.util.hash_pandas_object(df, index=False).sum())))
+
+def _frame_key(prefix: str, df: pd.DataFrame) -> str:
+    """Clé d'élément stable dérivée du contenu du DataFrame"""
+    return f"{prefix}-{_frame_hash(df)}"
+
+def _show_preview(df: pd.DataFrame, max_rows: int = 200):
+    """Affiche au plus max_rows lignes : la taille envoyée au navigateur reste bornée"""
+    st.dataframe(df.head(max_rows), use_container_width=True, hide_index=True)
+    if len(df) > max_rows:
+        st.caption(f"Aperçu limité aux {max_rows} premières lignes sur {len(df)}.")
+
+@st.cache_data(show_spinner=False)
+def _describe(frame_hash: int, _df: pd.DataFrame) -> pd.DataFrame:
+    """Statistiques descriptives, mises en cache sur l'empreinte du DataFrame"""
+    return _df.describe()
+
+# Mise en page commune à tous les graphiques de résultats
+_FIG_TEMPLATE = "plotly_white"
+_COMPONENT_COLORS = ('#3B82F6', '#EF4444', '#10B981', '#F59E0B', '#8B5CF6')
+
+@st.cache_data(show_spinner=False)
+def _group_counts(frame_hash: int, _df: pd.DataFrame, col: str) -> pd.Series:
+    """Effectifs par modalité, mis en cache sur l'empreinte du DataFrame et la colonne"""
+    return _df[col].value_counts(sort=False)
+
+@st.cache_data(show_spinner=False)
+def _period_columns(columns: tuple) -> list:
+    """Colonnes dont le nom évoque une période, mises en cache sur la liste des colonnes"""
+    index = pd.Index(columns)
+    matches = index.astype(str).str.contains('year|annee|periode|period', case=False, regex=True)
+    return index[matches].tolist()
+
+@st.cache_data(show_spinner=False)
+def _sorted_periods(frame_hash: int, _df: pd.DataFrame, col: str) -> list:
+    """Périodes distinctes triées, mises en cache sur l'empreinte du DataFrame et la colonne"""
+    return sorted(_df[col].dropna().unique())
+
+# Figures partagées entre sessions : cache borné pour limiter la mémoire du serveur
+@st.cache_resource(max_entries=64)
+def _bar_fig(xs: tuple, ys: tuple) -> "go.Figure":
+    """Diagramme en barres des contributions (mis en cache sur son contenu)"""
+    # Import différé : Plotly n'est chargé que lorsqu'un graphique est affiché
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[go.Bar(x=xs, y=ys)])
+    fig.update_layout(template=_FIG_TEMPLATE)
+    return fig
+
+@st.cache_resource(max_entries=64)
+def _evolution_fig(groups: tuple, y1: tuple, y2: tuple) -> "go.Figure":
+    """Évolution de y par groupe entre les deux périodes (mise en cache sur son contenu)"""
+    import plotly.graph_objects as go
+    # Deux traces construites directement : ni melt ni inférence de types
+    fig = go.Figure([
+        go.Bar(name='Période 1', x=groups, y=np.asarray(y1), marker_color='#EF4444'),
+        go.Bar(name='Période 2', x=groups, y=np.asarray(y2), marker_color='#10B981')
+    ])
+    fig.update_layout(barmode='group', title='Évolution de la variable y par groupe',
+                      height=400, template=_FIG_TEMPLATE)
+    return fig
+
+@st.cache_resource(max_entries=64)
+def _contributions_fig(names: tuple, explained: tuple, unexplained: tuple) -> "go.Figure":
+    """Contributions détaillées par variable (mises en cache sur leur contenu)"""
+    import plotly.graph_objects as go
+    fig = go.Figure([
+        go.Bar(name='Expliquée', x=names, y=explained, marker_color='#3B82F6'),
+        go.Bar(name='Non expliquée', x=names, y=unexplained, marker_color='#F59E0B')
+    ])
+    fig.update_layout(barmode='group', title='Contributions détaillées par variable',
+                      template=_FIG_TEMPLATE)
+    return fig
+
+@st.cache_resource(max_entries=64)
+def _components_bar_fig(comp_tuple: tuple) -> "go.Figure":
+    """Effets des composantes démographiques (mis en cache sur leur contenu)"""
+    import plotly.graph_objects as go
+    names, effects, _ = zip(*comp_tuple)
+    # Trace construite directement : pas d'introspection de DataFrame par plotly.express
+    fig = go.Figure(go.Bar(x=names, y=effects, marker_color=list(_COMPONENT_COLORS[:len(names)])))
+    fig.update_layout(title='Effets des composantes démographiques', template=_FIG_TEMPLATE)
+    return fig
+
+@st.cache_resource(max_entries=64)
+def _components_pie_fig(comp_tuple: tuple) -> "go.Figure":
+    """Répartition des contributions des composantes (mise en cache sur leur contenu)"""
+    import plotly.graph_objects as go
+    names, effects, _ = zip(*comp_tuple)
+    fig = go.Figure(go.Pie(labels=names, values=effects, hole=0.3,
+                           marker_colors=list(_COMPONENT_COLORS[:len(names)])))
+    fig.update_layout(title='Répartition des contributions', template=_FIG_TEMPLATE)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _run_demographic(frame_hash: int, _df: pd.DataFrame, group_col: str, w1_col: str, y1_col: str,
+                     w2_col: str, y2_col: str, normalize: bool) -> dict:
+    """Analyse démographique, mise en cache sur l'empreinte des données et les paramètres"""
+    results = _get_demographic().analyze(
+        df=_df, group_col=group_col,
+        w1_col=w1_col, y1_col=y1_col,
+        w2_col=w2_col, y2_col=y2_col,
+        normalize=normalize
+    )
+    if 'error' in results:
+        # Module indisponible : simulation des résultats pour l'affichage
+        results = _simulate_demographic_results(_df, group_col, y1_col, y2_col)
+    return results
+
+def _top_contributors(group_results: pd.DataFrame, k: int = 3):
+    """
+    Principaux contributeurs en une passe NumPy
+    
+    Returns:
+        (k groupes de plus forte contribution absolue, triés ; position de la plus
+        forte contribution positive ou None ; position de la plus négative ou None)
+    """
+    tc = group_results['total_contribution'].to_numpy()
+    ca = np.abs(tc)
+    k = min(k, len(tc))
+    top_idx = np.argpartition(-ca, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    top = group_results.iloc[top_idx[np.argsort(-ca[top_idx])]]
+    pos_idx = int(tc.argmax()) if (tc > 0).any() else None
+    neg_idx = int(tc.argmin()) if (tc < 0).any() else None
+    return top, pos_idx, neg_idx
+
+@st.cache_data(show_spinner=False)
+def _build_interpretation(agg_tuple: tuple, dp: int) -> str:
+    """
+    Texte d'interprétation (seuils 70%/30%), mis en cache sur les valeurs qui le composent
+    
+    agg_tuple : (ΔY, % composition, % comportement, (groupe, %) le plus positif
+    ou None, (groupe, %) le plus négatif ou None)
+    """
+    total_change, composition_percent, behavior_percent, top_pos, top_neg = agg_tuple
+    if composition_percent >= 70:
+        lines = ["Le changement s'explique **principalement par l'effet de composition**."]
+    elif behavior_percent >= 70:
+        lines = ["Le changement s'explique **principalement par l'effet de comportement**."]
+    else:
+        lines = ["Les effets de **composition et de comportement** contribuent tous deux au changement."]
+    lines.append(f"\nChangement total : **{total_change:.{dp}f}** "
+                 f"(composition {composition_percent:.1f}%, comportement {behavior_percent:.1f}%).\n")
+    if top_pos is not None:
+        lines.append(f"- Plus forte contribution positive : **{top_pos[0]}** ({top_pos[1]})")
+    if top_neg is not None:
+        lines.append(f"- Plus forte contribution négative : **{top_neg[0]}** ({top_neg[1]})")
+    return "\n".join(lines)
+
+def save_to_history(analysis_type, results):
+    """Sauvegarde une analyse dans l'historique"""
+    agg = results.get('aggregate_results', {}) if isinstance(results, dict) else {}
+    record = np.array([(
+        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        analysis_type,
+        agg.get('total_change', 0),
+        agg.get('composition_percent', 0),
+        agg.get('behavior_percent', 0)
+    )], dtype=_HIST_DTYPE)
+    history = np.concatenate((st.session_state.analysis_history, record))
+    st.session_state.analysis_history = history[-HISTORY_SIZE:]
+
+# ============================================================================
+# AFFICHAGE DES RÉSULTATS
+# ============================================================================
+@st.fragment
+def _render_demographic_results():
+    """Affiche les résultats démographiques (réexécuté isolément par Streamlit)"""
+    st.markdown("---")
+    st.subheader('📊 Résultats de l\'analyse démographique', divider='blue')
+    
+    results = st.session_state.results
+    decimal_places = st.session_state.get("decimal_places", 4)
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "📋 Tableau détaillé", 
+        "📈 Visualisations", 
+        "🎯 Résumé global", 
+        "📝 Interprétation", 
+        "💾 Export"
+    ])
+    
+    with tab1:
+        st.markdown("#### Contributions détaillées par groupe")
+        group_results = results['group_results']
+        # Formatage à l'affichage uniquement : les colonnes restent numériques
+        float_cols = group_results.select_dtypes(include=[np.floating]).columns.tolist()
+        styled = group_results.style.format(f"{{:.{decimal_places}f}}", subset=float_cols)
+        # Clé issue de l'empreinte des données et des paramètres : pas de rehachage
+        st.dataframe(styled, use_container_width=True,
+                     key=f"results-{st.session_state.results_key}")
+    
+    with tab2:
+        st.markdown("#### Visualisations graphiques")
+        col_viz1, col_viz2 = st.columns(2)
+        agg = results['aggregate_results']
+        with col_viz1:
+            sorted_results = results['group_results_sorted']
+            fig1 = _bar_fig(
+                tuple(sorted_results['group'].astype(str)),
+                tuple(sorted_results['total_contribution'])
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+        with col_viz2:
+            st.metric("Composition", f"{agg['composition_percent']:.1f}%")
+            st.progress(min(max(agg['composition_percent'] / 100, 0.0), 1.0))
+            st.metric("Comportement", f"{agg['behavior_percent']:.1f}%")
+            st.progress(min(max(agg['behavior_percent'] / 100, 0.0), 1.0))
+        
+        gr = results['group_results']
+        fig3 = _evolution_fig(tuple(gr['group'].astype(str)), tuple(gr['y1']), tuple(gr['y2']))
+        st.plotly_chart(fig3, use_container_width=True)
+            
+    with tab3:
+        st.markdown("#### Résumé global de l'analyse")
+        agg = results['aggregate_results']
+        col_met1, col_met2, col_met3 = st.columns(3)
+        with col_met1:
+            st.metric("Changement total (ΔY)", f"{agg['total_change']:.2f}")
+        with col_met2:
+            st.metric("Effet de composition", f"{agg['composition_effect']:.2f}", delta=f"{agg['composition_percent']:.1f}%")
+        with col_met3:
+            st.metric("Effet de comportement", f"{agg['behavior_effect']:.2f}", delta=f"{agg['behavior_percent']:.1f}%")
+        
+        st.markdown("**Principaux contributeurs :**")
+        gr = results['group_results_sorted']
+        top, pos_idx, neg_idx = _top_contributors(gr)
+        st.dataframe(
+            top[['group', 'total_contribution', 'contribution_percent_str']],
+            column_config={'contribution_percent_str': "contribution (%)"},
+            use_container_width=True, hide_index=True
+        )
+
+    with tab4:
+        st.markdown("#### Interprétation des résultats")
+        st.info("L'interprétation automatique se base sur les seuils standards (70%/30%).")
+        top_pos = (str(gr['group'].iat[pos_idx]), gr['contribution_percent_str'].iat[pos_idx]) if pos_idx is not None else None
+        top_neg = (str(gr['group'].iat[neg_idx]), gr['contribution_percent_str'].iat[neg_idx]) if neg_idx is not None else None
+        st.markdown(_build_interpretation(
+            (agg['total_change'], agg['composition_percent'], agg['behavior_percent'], top_pos, top_neg),
+            decimal_places
+        ))
+        
+    with tab5:
+        st.markdown("#### Options d'export")
+        # Encodage CSV fait une seule fois par jeu de résultats et précision
+        if (st.session_state.get('csv_for') is not results
+                or st.session_state.get('csv_decimals') != decimal_places):
+            st.session_state.csv_blob = results['group_results'].to_csv(
+                index=False, float_format=f"%.{decimal_places}f"
+            ).encode('utf-8')
+            st.session_state.csv_for = results
+            st.session_state.csv_decimals = decimal_places
+        st.download_button(
+            "📥 Télécharger les résultats (CSV)",
+            data=st.session_state.csv_blob,
+            file_name="decomposition_demographique.csv",
+            mime="text/csv"
+        )
+        with st.expander("🐍 Code Python de reproduction"):
+            v = results.get('metadata', {}).get('variables', {})
+            st.code(f"""import pandas as pd
+
+def kitagawa(df, group_col="{v.get('group', 'groupe')}", w1_col="{v.get('w1', 'w1')}", y1_col="{v.get('y1', 'y1')}",
+             w2_col="{v.get('w2', 'w2')}", y2_col="{v.get('y2', 'y2')}"):
+    # Calcul vectorisé sur les colonnes entières (poids exprimés en %)
+    w1 = df[w1_col].to_numpy(dtype=float)
+    y1 = df[y1_col].to_numpy(dtype=float)
+    w2 = df[w2_col].to_numpy(dtype=float)
+    y2 = df[y2_col].to_numpy(dtype=float)
+    comp = 0.5 * (y1 + y2) * (w2 - w1) / 100
+    behav = 0.5 * (w1 + w2) * (y2 - y1) / 100
+    return pd.DataFrame({{
+        'groupe': df[group_col].to_numpy(),
+        'effet_composition': comp,
+        'effet_comportement': behav,
+        'contribution_totale': comp + behav
+    }})
+""", language="python")
+        
+        if st.button("📥 Générer le fichier Excel"):
+            # Classeur écrit en mémoire : aucun fichier temporaire sur disque
+            from modules.utils import Exporter
+            st.session_state.excel_bytes = Exporter.to_excel(results).getvalue()
+        if st.session_state.get('excel_bytes') is not None:
+            st.download_button(
+                "💾 Télécharger le fichier Excel",
+                data=st.session_state.excel_bytes,
+                file_name="decomposition_demographique.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+
+@st.fragment
+def _structural_nested_panel(df, outcome_var, primary_group, secondary_groups, period_var,
+                             period1, period2):
+    """Lancement et résultats de la décomposition emboîtée (réexécutés isolément)"""
+    if st.button("🚀 Lancer la décomposition emboîtée", type="primary",
+                 use_container_width=True, key="struct_run"):
+        if not secondary_groups or period1 == period2:
+            st.error("❌ Choisissez au moins un groupe secondaire et deux périodes distinctes.")
+        else:
+            with st.spinner("🔍 Décomposition en cours..."):
+                try:
+                    results = _nested(
+                        st.session_state.data_meta['hash'], df, outcome_var, primary_group,
+                        secondary_groups, (period1, period2), period_var
+                    )
+                    st.session_state.results = results
+                    st.session_state.analysis_type = "structural"
+                    primary = results['levels']['primary']['_global']
+                    save_to_history("structural", {'aggregate_results': {
+                        'total_change': primary['delta_Y'],
+                        'composition_percent': primary['composition_percent'],
+                        'behavior_percent': primary['behavior_percent']
+                    }})
+                    st.success("✅ Analyse terminée avec succès!")
+                except Exception as e:
+                    st.error(f"❌ Erreur lors de l'analyse: {str(e)}")
+    
+    results = st.session_state.results
+    if results and st.session_state.analysis_type == "structural" and 'levels' in results:
+        primary = results['levels']['primary']['_global']
+        st.subheader('📊 Résultats structurels', divider='blue')
+        col_met1, col_met2, col_met3 = st.columns(3)
+        with col_met1:
+            st.metric("Changement total", f"{primary['delta_Y']:.4f}")
+        with col_met2:
+            st.metric("Effet de composition", f"{primary['composition_effect']:.4f}",
+                      delta=f"{primary['composition_percent']:.1f}%")
+        with col_met3:
+            st.metric("Effet de comportement", f"{primary['behavior_effect']:.4f}",
+                      delta=f"{primary['behavior_percent']:.1f}%")
+    
+        # Contributions conditionnelles : une ligne par (catégorie, groupe secondaire),
+        # tableau construit une seule fois par jeu de résultats
+        if st.session_state.get('struct_view_for') is not results:
+            secondary = results['hierarchical_contributions']['secondary']
+            rows = [(str(category), var, contrib['composition'], contrib['behavior'])
+                    for category, by_var in secondary.items()
+                    for var, contrib in by_var.items()]
+            st.session_state.struct_view = pd.DataFrame(
+                rows, columns=['Catégorie', 'Groupe secondaire', 'Composition (%)', 'Comportement (%)']
+            )
+            st.session_state.struct_view_for = results
+        st.markdown(f"**Contributions au sein de chaque catégorie de {results['primary_group']} (%) :**")
+        st.dataframe(
+            st.session_state.struct_view
+            .style.format("{:.1f}", subset=['Composition (%)', 'Comportement (%)']),
+            use_container_width=True, hide_index=True
+        )
+
+@st.fragment
+def _structural_components_panel(initial_pop, final_pop, fertility_rate1, fertility_rate2,
+                                 mortality_rate1, mortality_rate2, migration_rate1, migration_rate2):
+    """Simulation et résultats des composantes démographiques (réexécutées isolément)"""
+    if st.button("🔍 Simuler la décomposition démographique", type="primary",
+                 use_container_width=True, key="struct_components_run"):
+        # Paramètres scalaires : un nouveau clic sur les mêmes valeurs est lu en cache
+        results = _demographic_decomp(initial_pop, final_pop, fertility_rate1, fertility_rate2,
+                                      mortality_rate1, mortality_rate2, migration_rate1, migration_rate2)
+        st.session_state.results = results
+        st.session_state.analysis_type = "structural"
+        # Pas de parts composition/comportement pour une simulation : valeurs manquantes
+        save_to_history("structural", {'aggregate_results': {
+            'total_change': results['total_change'],
+            'composition_percent': np.nan,
+            'behavior_percent': np.nan
+        }})
+    
+    results = st.session_state.results
+    if results and st.session_state.analysis_type == "structural" \
+            and results.get('type') == 'demographic_components':
+        st.subheader('📊 Résultats structurels', divider='blue')
+        st.metric("Changement total de population", f"{results['total_change']:,.0f}")
+        # Tableau et clé des figures préparés une seule fois par jeu de résultats
+        # (comparaison d'identité : la référence conservée empêche la réutilisation d'un id)
+        if st.session_state.get('struct_view_for') is not results:
+            # Colonnes typées construites directement : pas d'inférence ligne à ligne
+            components = results['components']
+            names = [name.capitalize() for name in components]
+            effects = np.fromiter((c['effect'] for c in components.values()),
+                                  dtype=np.float64, count=len(components))
+            pcts = np.fromiter((c['percent'] for c in components.values()),
+                               dtype=np.float64, count=len(components))
+            # Table Arrow : transmise telle quelle par st.dataframe, sans conversion depuis pandas
+            comp_table = pa.table({'Composante': names, 'Effet': effects, 'Pourcentage': pcts})
+            # Clé hashable : les figures ne sont reconstruites que si les effets changent
+            comp_tuple = tuple(zip(names, effects.tolist(), pcts.tolist()))
+            st.session_state.struct_view = (comp_table, comp_tuple)
+            st.session_state.struct_view_for = results
+        comp_table, comp_tuple = st.session_state.struct_view
+        st.dataframe(
+            comp_table,
+            column_config={
+                'Effet': st.column_config.NumberColumn(format="%.0f"),
+                'Pourcentage': st.column_config.NumberColumn(format="%.1f%%")
+            },
+            use_container_width=True, hide_index=True
+        )
+    
+        col_fig1, col_fig2 = st.columns(2)
+        with col_fig1:
+            st.plotly_chart(_components_bar_fig(comp_tuple), use_container_width=True)
+        with col_fig2:
+            st.plotly_chart(_components_pie_fig(comp_tuple), use_container_width=True)
+
+# ============================================================================
+# HEADER PRINCIPAL
+# ============================================================================
+st.markdown(
+    _CSS + '<h1 class="main-header fade-in">📊 APPLICATION D\'ANALYSE DE DÉCOMPOSITION SOCIALE</h1>',
+    unsafe_allow_html=True
+)
+
+st.info("""
+**🚀 Transformez vos nuits blanches de calculs Excel en analyses rigoureuses en quelques clics**
+
+Cet outil implémente les méthodes de décomposition pour l'étude du changement social selon le manuel IFORD.
+Identifiez les sources du changement social (effets de composition vs comportement) de manière simple et rigoureuse.
+""")
+
+# ============================================================================
+# SIDEBAR - NAVIGATION ET CONFIGURATION
+# ============================================================================
+with st.sidebar:
+    # Logo et titre
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.image("https://cdn-icons-png.flaticon.com/512/1995/1995515.png", width=60)
+    with col2:
+        st.markdown("### 🔍 Navigation")
+    
+    st.markdown("---")
+    
+    # Sélection du type d'analyse
+    analysis_type = st.radio(
+        "**CHOISISSEZ LE TYPE D'ANALYSE :**",
+        [
+            "🏠 Accueil et Guide",
+            "👥 Décomposition Démographique", 
+            "➗ Décomposition Mathématique",
+            "📈 Décomposition de Régression", 
+            "🏗️ Décomposition Structurelle",
+            "📚 Documentation et Exemples"
+        ],
+        key="nav_analysis_type"
+    )
+    
+    st.markdown("---")
+    
+    # Section de chargement de données
+    st.markdown("### 📁 CHARGEMENT DES DONNÉES")
+    
+    uploaded_file = st.file_uploader(
+        "Importer vos données :",
+        type=['csv', 'xlsx', 'xls'],
+        help="Formats acceptés: CSV, Excel (xlsx, xls)",
+        key="file_uploader"
+    )
+    
+    if uploaded_file is not None:
+        try:
+            # Lecture et empreinte uniquement quand le fichier importé change
+            if st.session_state.upload_id != uploaded_file.file_id:
+                set_current_data(_parse_upload(uploaded_file.name, uploaded_file.getvalue()))
+                st.session_state.upload_id = uploaded_file.file_id
+                st.session_state.file_uploaded = True
+            df = st.session_state.current_data
+            
+            st.success(f"✅ Fichier chargé : {uploaded_file.name}")
+            st.info(f"Dimensions : {df.shape[0]} lignes × {df.shape[1]} colonnes")
+            
+            with st.expander("👁️ Aperçu rapide"):
+                preview = df.head()
+                st.dataframe(preview, use_container_width=True, key=_frame_key("prev", preview))
+                
+        except Exception as e:
+            st.error(f"❌ Erreur de chargement : {str(e)}")
+    
+    # Boutons d'action rapide
+    st.markdown("### ⚡ ACTIONS RAPIDES")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("📋 Exemples", use_container_width=True):
+            st.session_state.use_example = True
+    with col2:
+        if st.button("🔄 Réinitialiser", use_container_width=True):
+            reset_application()
+    
+    # Informations sur les données actuelles
+    if st.session_state.data_meta is not None:
+        st.markdown("---")
+        st.markdown("### 📊 DONNÉES CHARGÉES")
+        meta = st.session_state.data_meta
+        st.metric("Lignes", meta['rows'])
+        st.metric("Colonnes", meta['cols'])
+        st.caption(f"Colonnes : {', '.join(meta['head_cols'])}{'...' if meta['cols'] > 5 else ''}")
+    
+    # Statistiques d'utilisation : analyses de la session par type
+    if st.session_state.analysis_history.size:
+        st.markdown("---")
+        st.markdown("### 📈 STATISTIQUES D'UTILISATION")
+        type_counts = Counter(st.session_state.analysis_history['type'].tolist())
+        for analysis_kind, count in type_counts.most_common():
+            st.metric(analysis_kind.capitalize(), count)
+    
+    st.markdown("---")
+    
+    # Pied de page de la sidebar
+    st.caption(_SIDEBAR_FOOTER_MD)
+
+# ============================================================================
+# PAGE D'ACCUEIL
+# ============================================================================
+# Cartes de présentation : (titre, contenu), rendues chacune par un seul st.markdown
+_HOME_CARDS = (
+    ("👥 Démographique", """
+**Effets composition/comportement**
+
+ΔY = Σ(ȳⱼΔwⱼ) + Σ(ẇⱼΔyⱼ)
+
+*Par groupes, régions, etc.*
+"""),
+    ("➗ Mathématique", """
+**Formules exactes**
+
+Δ(Y/Z) = (1/Ƶ)ΔY - (Ȳ/Ƶ²)ΔZ
+
+*Ratios, produits, etc.*
+"""),
+    ("📈 Régression", """
+**Oaxaca-Blinder**
+
+ΔY = Δα + β̄ΔX + X̄Δβ
+
+*Écarts entre groupes*
+"""),
+    ("🏗️ Structurelle", """
+**Analyses complexes**
+
+*Multi-niveaux*
+*Emboîtée*
+*Cheminement*
+"""),
+)
+
+@st.fragment
+def _home_static_cards():
+    """Cartes de présentation des types d'analyse"""
+    for col, (title, body) in zip(st.columns(len(_HOME_CARDS)), _HOME_CARDS):
+        with col:
+            with st.container(border=True):
+                st.markdown(f"### {title}\n{body}")
+
+@st.fragment
+def _home_history():
+    """Historique des analyses de la session"""
+    if st.session_state.analysis_history.size:
+        st.subheader('📈 Historique des analyses', divider='blue')
+        
+        # Le tableau structuré est converti directement, sans inférence de types
+        st.dataframe(
+            pd.DataFrame(st.session_state.analysis_history),
+            column_config={
+                "timestamp": "Date/Heure",
+                "type": "Type d'analyse",
+                "total_change": st.column_config.NumberColumn("Δ Total", format="%.4f"),
+                "composition_percent": st.column_config.NumberColumn("% Composition", format="%.1f%%"),
+                "behavior_percent": st.column_config.NumberColumn("% Comportement", format="%.1f%%")
+            },
+            use_container_width=True
+        )
+
+if analysis_type == "🏠 Accueil et Guide":
+    st.subheader('🏠 Bienvenue dans l\'outil d\'analyse de décomposition', divider='blue')
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### 📋 Qu'est-ce que la décomposition ?
+        
+        La **décomposition** est une méthode statistique qui permet de comprendre **les sources d'un changement social** en séparant les effets de **composition** et de **comportement**.
+        
+        ### 🎯 Pourquoi utiliser cette application ?
+        
+        1. **Simplifier** les analyses complexes de décomposition
+        2. **Automatiser** les calculs fastidieux
+        3. **Visualiser** les résultats de manière intuitive
+        4. **Documenter** les analyses de manière professionnelle
+        5. **Réduire les erreurs** de calcul manuel
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### 🚀 Démarrage rapide
+        
+        1. **Sélectionnez** un type d'analyse
+        2. **Chargez** vos données
+        3. **Configurez** les paramètres
+        4. **Visualisez** les résultats
+        5. **Exportez** votre rapport
+        """)
+    
+    st.markdown("---")
+    
+    st.subheader('📊 Types d\'analyse disponibles', divider='blue')
+    
+    _home_static_cards()
+    
+    st.markdown("---")
+    
+    _home_history()
+    
+    st.markdown("---")
+    st.warning("""
+    **💡 Conseil pédagogique :** Commencez par un exemple pour comprendre la logique avant d'importer vos propres données.
+    
+    **👉 Sélectionnez un type d'analyse dans le menu de gauche pour commencer !**
+    """)
+
+# ============================================================================
+# MODULE DÉCOMPOSITION DÉMOGRAPHIQUE
+# ============================================================================
+elif analysis_type == "👥 Décomposition Démographique":
+    st.subheader('👥 Décomposition Démographique', divider='blue')
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.info("""
+        **Définition :** Cette méthode décompose un changement observé au niveau agrégé en deux effets :
+        
+        1. **Effet de composition** : changement dû aux variations dans la répartition des groupes
+        2. **Effet de comportement** : changement dû aux variations dans les comportements moyens des groupes
+        """)
+    
+    with col2:
+        with st.container(border=True):
+            st.markdown(_KITAGAWA_FORMULA_MD)
+    
+    st.markdown("---")
+    st.subheader('📥 Données d\'entrée', divider='blue')
+    
+    data_option = st.radio(
+        "Source des données :",
+        ["📤 Importer un fichier", "📋 Utiliser un exemple", "✍️ Saisie manuelle"],
+        horizontal=True,
+        key="demographic_data_option"
+    )
+    
+    if data_option == "📤 Importer un fichier":
+        if st.session_state.current_data is not None:
+            df = st.session_state.current_data
+            with st.expander("🔍 Visualisation des données", expanded=True):
+                _show_preview(df)
+                st.markdown("**Statistiques descriptives :**")
+                st.dataframe(_describe(st.session_state.data_meta['hash'], df), use_container_width=True)
+        else:
+            st.warning("⚠️ Aucun fichier chargé. Utilisez l'importeur dans la sidebar.")
+    
+    elif data_option == "📋 Utiliser un exemple":
+        example_choice = st.selectbox(
+            "Choisir un exemple :",
+            list(EXAMPLE_BUILDERS),
+            key="demographic_example"
+        )
+        
+        if st.button("📥 Charger cet exemple", type="primary"):
+            with st.spinner("Chargement de l'exemple..."):
+                df = load_example_data(example_choice)
+                if df is not None:
+                    st.success(f"✅ Exemple '{example_choice}' chargé avec succès!")
+                    _show_preview(df)
+    
+    else:  # Saisie manuelle
+        st.info("💡 Créez votre propre ensemble de données")
+        num_groups = st.number_input("Nombre de groupes :", min_value=2, max_value=20, value=5, step=1)
+        if st.button("📝 Créer le tableau de saisie", type="secondary"):
+            st.session_state.manual_data_ready = True
+        
+        if st.session_state.get('manual_data_ready', False):
+            st.markdown("**Saisie des données par groupe :**")
+            template = pd.DataFrame({
+                'Groupe': [f"Groupe {i+1}" for i in range(num_groups)],
+                'w_2015': 20.0, 'y_2015': 50.0, 'w_2020': 25.0, 'y_2020': 60.0
+            })
+            edited = st.data_editor(
+                template,
+                num_rows="fixed",
+                column_config={
+                    'w_2015': st.column_config.NumberColumn("w₁", min_value=0.0),
+                    'y_2015': st.column_config.NumberColumn("y₁"),
+                    'w_2020': st.column_config.NumberColumn("w₂", min_value=0.0),
+                    'y_2020': st.column_config.NumberColumn("y₂")
+                },
+                use_container_width=True,
+                key="manual_editor"
+            )
+            
+            if st.button("✅ Valider la saisie manuelle"):
+                set_current_data(edited)
+                st.success("Données manuelles validées!")
+    
+    if st.session_state.current_data is not None:
+        st.markdown("---")
+        st.subheader('⚙️ Configuration de l\'analyse', divider='blue')
+        
+        df = st.session_state.current_data
+        col_names = list(df.columns)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("**Variables de groupe :**")
+            group_col = st.selectbox("Colonne des groupes :", col_names, index=0)
+            period_names = st.text_input("Noms des périodes :", value="2015, 2020")
+        
+        with col2:
+            st.markdown("**Variables période 1 :**")
+            w1_col = st.selectbox("w₁ (poids) :", col_names, index=1 if len(col_names) > 1 else 0)
+            y1_col = st.selectbox("y₁ (valeur) :", col_names, index=2 if len(col_names) > 2 else 0)
+        
+        with col3:
+            st.markdown("**Variables période 2 :**")
+            w2_col = st.selectbox("w₂ (poids) :", col_names, index=3 if len(col_names) > 3 else 0)
+            y2_col = st.selectbox("y₂ (valeur) :", col_names, index=4 if len(col_names) > 4 else 0)
+        
+        st.markdown("**Options d'analyse :**")
+        col_opt1, col_opt2, col_opt3 = st.columns(3)
+        with col_opt1:
+            normalize = st.checkbox("Normaliser les poids à 100%", value=True)
+        with col_opt2:
+            confidence_level = st.slider("Niveau de confiance :", 0.90, 0.99, 0.95, 0.01)
+        with col_opt3:
+            decimal_places = st.selectbox("Décimales :", [2, 3, 4, 5], index=2, key="decimal_places")
+        
+        # Empreinte des entrées de l'analyse : les options d'affichage n'en font pas partie
+        inputs_hash = hash((st.session_state.data_meta['hash'], group_col,
+                            w1_col, y1_col, w2_col, y2_col, normalize))
+        
+        if st.button("🚀 Lancer l'analyse démographique", type="primary", use_container_width=True):
+            if (st.session_state.results and st.session_state.analysis_type == "demographic"
+                    and st.session_state.get('results_key') == inputs_hash):
+                st.info("ℹ️ Paramètres inchangés : les résultats précédents sont conservés.")
+            else:
+                with st.spinner("🔍 Analyse en cours..."):
+                    try:
+                        results = _run_demographic(
+                            st.session_state.data_meta['hash'], df,
+                            group_col, w1_col, y1_col, w2_col, y2_col, normalize
+                        )
+
+                        st.session_state.results = results
+                        st.session_state.results_key = inputs_hash
+                        st.session_state.excel_bytes = None
+                        st.session_state.analysis_type = "demographic"
+                        save_to_history("demographic", results)
+                    
+                        st.success("✅ Analyse terminée avec succès!")
+                    except Exception as e:
+                        st.error(f"❌ Erreur lors de l'analyse: {str(e)}")
+                        st.info("Vérifiez la sélection de vos colonnes et le format de vos données.")
+
+    # Affichage des résultats
+    if st.session_state.results and st.session_state.analysis_type == "demographic":
+        _render_demographic_results()
+
+# ============================================================================
+# MODULE DÉCOMPOSITION MATHÉMATIQUE
+# ============================================================================
+elif analysis_type == "➗ Décomposition Mathématique":
+    st.subheader('➗ Décomposition Mathématique', divider='blue')
+    
+    formulas = getattr(_get_mathematical(), 'formulas', {})
+    if not formulas:
+        st.info("Ce module n'est pas disponible dans cette installation.")
+    else:
+        with st.sidebar:
+            _formula_guide()
+        
+        # 'product_simple' n'a pas encore de règle de calcul dans le module
+        formula_names = {key: f.name for key, f in formulas.items() if key != 'product_simple'}
+        formula_type = st.selectbox(
+            "Formule :",
+            list(formula_names),
+            format_func=formula_names.get,
+            key="math_formula"
+        )
+        formula = formulas[formula_type]
+        st.code(f"{formula.expression}\n{formula.decomposition_rule}", language=None)
+        
+        col_p1, col_p2 = st.columns(2)
+        with col_p1:
+            period1 = st.text_input("Période 1 :", value="2015", key="math_period1")
+        with col_p2:
+            period2 = st.text_input("Période 2 :", value="2020", key="math_period2")
+        
+        payload = []
+        for var in formula.variables:
+            col_v1, col_v2 = st.columns(2)
+            with col_v1:
+                v1 = st.number_input(f"{var} ({period1})", value=1.0, format="%.4f",
+                                     key=f"math_{formula_type}_{var}_1")
+            with col_v2:
+                v2 = st.number_input(f"{var} ({period2})", value=1.0, format="%.4f",
+                                     key=f"math_{formula_type}_{var}_2")
+            payload.append((var, v1, v2))
+        
+        if st.button("🚀 Analyser", type="primary", use_container_width=True, key="math_run"):
+            try:
+                st.session_state.results = _run_math(formula_type, tuple(payload), (period1, period2))
+                st.session_state.results_by_formula[formula_type] = st.session_state.results
+                st.session_state.analysis_type = "mathematical"
+            except Exception as e:
+                st.error(f"❌ Erreur lors de l'analyse: {str(e)}")
+        
+        # Seuls les résultats de la formule sélectionnée sont affichés
+        results = st.session_state.results_by_formula.get(formula_type)
+        if results:
+            st.subheader('📊 Résultats de la décomposition', divider='blue')
+            st.caption(results.get('formula', ''))
+            
+            effects = results['effects']
+            total_effect = effects['total_effect']
+            names = [name for name in effects if name != 'total_effect']
+            values = np.fromiter((effects[name] for name in names), dtype=np.float64, count=len(names))
+            # Effet total nul : contributions à 0 sans avertissement de division
+            with np.errstate(divide='ignore', invalid='ignore'):
+                percents = np.where(total_effect != 0, values / total_effect * 100.0, 0.0)
+            st.metric("Effet total", f"{total_effect:.4f}")
+            st.dataframe(
+                pd.DataFrame({
+                    'Effet': names,
+                    'Valeur': values,
+                    'Contribution (%)': percents
+                }),
+                use_container_width=True, hide_index=True
+            )
+            st.plotly_chart(_bar_fig(tuple(names), tuple(values)), use_container_width=True)
+            
+            period_values = results.get('values') or results.get('components')
+            if period_values:
+                # Mise en forme vectorisée (np.char.mod) plutôt qu'un format par cellule
+                st.markdown("**Valeurs par période :**")
+                labels = list(period_values['period1'])
+                st.dataframe(
+                    pd.DataFrame({
+                        'Variable': labels,
+                        **{period: np.char.mod('%.4f', np.fromiter(vals.values(), dtype=np.float64,
+                                                                  count=len(labels)))
+                           for period, vals in period_values.items()}
+                    }),
+                    use_container_width=True, hide_index=True
+                )
+
+# ============================================================================
+# MODULE DÉCOMPOSITION DE RÉGRESSION
+# ============================================================================
+elif analysis_type == "📈 Décomposition de Régression":
+    st.subheader('📈 Décomposition de Régression', divider='blue')
+    st.info("""
+    **Oaxaca-Blinder :** l'écart moyen entre deux groupes est décomposé en une partie
+    **expliquée** par les caractéristiques observables et une partie **non expliquée**.
+    """)
+    
+    analyzer = _get_regression()
+    if not hasattr(analyzer, 'oaxaca_blinder'):
+        st.info("Ce module n'est pas disponible dans cette installation.")
+    else:
+        if st.button("📥 Charger un exemple Oaxaca-Blinder", key="reg_example"):
+            load_example_data(DEFAULT_EXAMPLE)
+        
+        if st.session_state.current_data is None:
+            st.warning("⚠️ Aucune donnée chargée. Utilisez l'importeur dans la sidebar ou l'exemple.")
+        else:
+            df = st.session_state.current_data
+            numeric_cols = df.select_dtypes(include='number').columns.tolist()
+            other_cols = [c for c in df.columns if c not in numeric_cols] or list(df.columns)
+            
+            col1, col2 = st.columns(2)
+            with col2:
+                # Présélection d'une colonne de genre usuelle (intersection d'ensembles)
+                gender_cols = {'gender', 'sexe', 'genre'} & set(other_cols)
+                default_group = next(iter(gender_cols), None)
+                group_var = st.selectbox("Variable de groupe :", other_cols,
+                                         index=other_cols.index(default_group) if default_group else 0,
+                                         key="reg_group_var")
+                groups = df[group_var].dropna().unique().tolist()
+                group1 = st.selectbox("Groupe de référence :", groups, index=0, key="reg_group1")
+                group2 = st.selectbox("Groupe comparé :", groups,
+                                      index=1 if len(groups) > 1 else 0, key="reg_group2")
+            with col1:
+                outcome = st.selectbox("Variable dépendante :", numeric_cols,
+                                       index=max(len(numeric_cols) - 1, 0), key="reg_outcome")
+                # Exclusions en un seul ensemble : la variable dépendante et celle de groupe
+                _excluded = {outcome, group_var}
+                candidates = [c for c in numeric_cols if c not in _excluded]
+                predictors = st.multiselect("Variables explicatives :", candidates,
+                                            default=candidates, key="reg_predictors")
+            method = st.selectbox("Méthode :", analyzer.methods, format_func=_METHOD_LABELS.get,
+                                  key="reg_method")
+            
+            with st.expander(f"📊 Distribution par {group_var}"):
+                st.bar_chart(_group_counts(st.session_state.data_meta['hash'], df, group_var))
+            
+            if st.button("🚀 Lancer la décomposition", type="primary", use_container_width=True, key="reg_run"):
+                if not predictors or group1 == group2:
+                    st.error("❌ Choisissez au moins une variable explicative et deux groupes distincts.")
+                else:
+                    with st.spinner("🔍 Estimation des régressions..."):
+                        try:
+                            st.session_state.results = _oaxaca(
+                                st.session_state.data_meta['hash'], df, outcome, tuple(predictors),
+                                group_var, group1, group2, method
+                            )
+                            st.session_state.analysis_type = "regression"
+                        except Exception as e:
+                            # Pas de résultats antérieurs affichés comme s'ils étaient à jour
+                            st.session_state.results = {}
+                            st.error(f"❌ Erreur lors de l'analyse: {str(e)}")
+            
+            if st.session_state.results and st.session_state.analysis_type == "regression":
+                decomp = st.session_state.results['decomposition']
+                st.subheader('📊 Résultats de la décomposition', divider='blue')
+                col_met1, col_met2, col_met3 = st.columns(3)
+                with col_met1:
+                    st.metric("Écart total", f"{decomp['total_difference']:.4f}")
+                with col_met2:
+                    st.metric("Partie expliquée", f"{decomp['explained_difference']:.4f}",
+                              delta=f"{decomp['explained_percent']:.1f}%")
+                with col_met3:
+                    st.metric("Partie non expliquée", f"{decomp['unexplained_difference']:.4f}",
+                              delta=f"{decomp['unexplained_percent']:.1f}%")
+                
+                # Coefficients et moyennes des deux groupes : un seul tableau chacun
+                results = st.session_state.results
+                g1, g2 = results['groups']['group1'], results['groups']['group2']
+                reg_results = results['regression_results']
+                st.markdown("**Coefficients estimés :**")
+                st.dataframe(
+                    pd.DataFrame({str(g1): reg_results[g1]['coef'], str(g2): reg_results[g2]['coef']})
+                    .style.format("{:.4f}"),
+                    use_container_width=True
+                )
+                detailed = results.get('detailed_contributions') or {}
+                if detailed:
+                    # Colonnes construites directement en tableaux (pas de liste de dicts)
+                    names = tuple(detailed)
+                    expl = np.fromiter((c['explained'] for c in detailed.values()),
+                                       dtype=np.float64, count=len(names))
+                    unex = np.fromiter((c['unexplained'] for c in detailed.values()),
+                                       dtype=np.float64, count=len(names))
+                    st.dataframe(
+                        pd.DataFrame({'Variable': names, 'Expliquée': expl,
+                                      'Non expliquée': unex, 'Totale': expl + unex}),
+                        use_container_width=True, hide_index=True
+                    )
+                    st.plotly_chart(_contributions_fig(names, tuple(expl.tolist()), tuple(unex.tolist())),
+                                    use_container_width=True)
+                
+                st.markdown("**Moyennes des variables explicatives :**")
+                st.dataframe(
+                    pd.DataFrame({str(g1): results['means'][g1]['X'], str(g2): results['means'][g2]['X']})
+                    .style.format("{:.4f}"),
+                    use_container_width=True
+                )
+
+# ============================================================================
+# MODULE DÉCOMPOSITION STRUCTURELLE
+# ============================================================================
+elif analysis_type == "🏗️ Décomposition Structurelle":
+    st.subheader('🏗️ Décomposition Structurelle', divider='blue')
+    st.info(_STRUCT_INFO_MD)
+    
+    analyzer = _get_structural()
+    if not hasattr(analyzer, 'nested_decomposition'):
+        st.info("Ce module n'est pas disponible dans cette installation.")
+    else:
+        structural_type = st.radio(
+            "Type d'analyse structurelle :",
+            ["Décomposition emboîtée hiérarchique", "Analyse des composantes démographiques"],
+            horizontal=True,
+            key="struct_type"
+        )
+        
+        if structural_type == "Décomposition emboîtée hiérarchique":
+            if st.button("📥 Charger un exemple de décomposition emboîtée", key="struct_example"):
+                load_example_data(STRUCTURAL_EXAMPLE)
+            
+            if st.session_state.current_data is None:
+                st.warning("⚠️ Aucune donnée chargée. Utilisez l'importeur dans la sidebar ou l'exemple.")
+            else:
+                df = st.session_state.current_data
+                col_names = df.columns.tolist()
+                numeric_cols = df.select_dtypes(include='number').columns.tolist()
+                period_cols = _period_columns(tuple(col_names))
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    outcome_var = st.selectbox("Variable d'intérêt :", numeric_cols,
+                                               index=max(len(numeric_cols) - 1, 0), key="struct_outcome")
+                    period_var = st.selectbox("Variable de période :", period_cols or col_names,
+                                              key="struct_period_var")
+                    periods = _sorted_periods(st.session_state.data_meta['hash'], df, period_var)
+                    period1 = st.selectbox("Période 1 :", periods, index=0, key="struct_period1")
+                    period2 = st.selectbox("Période 2 :", periods, index=len(periods) - 1,
+                                           key="struct_period2")
+                with col2:
+                    _excluded = {outcome_var, period_var}
+                    primary_group = st.selectbox(
+                        "Groupe principal :",
+                        [col for col in col_names if col not in _excluded],
+                        key="struct_primary"
+                    )
+                    _excluded.add(primary_group)
+                    available_secondary = [col for col in col_names if col not in _excluded]
+                    secondary_groups = st.multiselect(
+                        "Groupes secondaires :", available_secondary,
+                        default=[col for col in available_secondary if col not in numeric_cols],
+                        key="struct_secondary"
+                    )
+                
+                _structural_nested_panel(df, outcome_var, primary_group, tuple(secondary_groups),
+                                         period_var, period1, period2)
+        
+        else:
+            st.caption("Taux pour 1000 habitants, cumulés sur chaque période.")
+            col1, col2 = st.columns(2)
+            with col1:
+                initial_pop = st.number_input("Population initiale :", min_value=1.0, value=1_000_000.0,
+                                              step=10_000.0, key="struct_initial_pop")
+                fertility_rate1 = st.slider("Natalité, période 1 (‰)", 0.0, 300.0, 180.0, key="struct_f1")
+                mortality_rate1 = st.slider("Mortalité, période 1 (‰)", 0.0, 200.0, 60.0, key="struct_m1")
+                migration_rate1 = st.slider("Migration nette, période 1 (‰)", -50.0, 50.0, -5.0, key="struct_mig1")
+            with col2:
+                final_pop = st.number_input("Population finale :", min_value=1.0, value=1_150_000.0,
+                                            step=10_000.0, key="struct_final_pop")
+                fertility_rate2 = st.slider("Natalité, période 2 (‰)", 0.0, 300.0, 160.0, key="struct_f2")
+                mortality_rate2 = st.slider("Mortalité, période 2 (‰)", 0.0, 200.0, 50.0, key="struct_m2")
+                migration_rate2 = st.slider("Migration nette, période 2 (‰)", -50.0, 50.0, -3.0, key="struct_mig2")
+            
+            _structural_components_panel(initial_pop, final_pop, fertility_rate1, fertility_rate2,
+                                         mortality_rate1, mortality_rate2, migration_rate1, migration_rate2)
+
+elif analysis_type == "📚 Documentation et Exemples":
+    st.subheader('📚 Documentation et Exemples', divider='blue')
+    for tab, (_, body) in zip(st.tabs([title for title, _ in _DOC_TABS]), _DOC_TABS):
+        with tab:
+            st.markdown(body)
+    st.caption("Documentation complète disponible dans le manuel utilisateur.")
+
+# ============================================================================
+# FOOTER GLOBAL
+# ============================================================================
+st.markdown("---")
+
+with st.container(border=True):
+    st.markdown("**Power by Lab_Math and SCSM Group & CIE.**")
+    st.caption("Copyright 2026, tous droits réservés.")
+    st.markdown("📧 Contact : info@labmath-scsm.com. · 🌐 Site : www.labmath-scsm.com. · 📱 Support : +237 620 307 439.")
+    st.caption(_FOOTER_MD)
+
+# Animation ballons si première visite
+if 'show_welcome' not in st.session_state:
+    st.session_state.show_welcome = True
+
+if st.session_state.show_welcome:
+    with st.sidebar:
         st.session_state.show_welcome = False
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Jeux de données d'exemple pour l'application de décomposition
+Chaque exemple est produit par une fonction dédiée ; l'application met le
+résultat en cache, si bien qu'un exemple n'est construit qu'à sa première demande
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict
+
+DEFAULT_EXAMPLE = "Écarts salariaux H/F"
+STRUCTURAL_EXAMPLE = "Revenus par région, sexe et éducation (2015-2020)"
+
+def wage_example(n: int = 200, seed: int = 42) -> pd.DataFrame:
+    """Génère l'exemple synthétique des écarts salariaux H/F"""
+    rng = np.random.default_rng(seed)
+    # Chaque vecteur est tiré une seule fois et réutilisé dans le salaire
+    is_male = rng.random(n) < 0.6
+    education = rng.normal(12, 3, n).clip(0, 20)
+    experience = rng.exponential(10, n).clip(0, 40)
+    noise = rng.normal(0, 3000, n)
+    salaire = 30000 + 5000*is_male + 2000*education + 800*experience + noise
+    return pd.DataFrame({
+        'genre': pd.Categorical.from_codes(is_male.astype(np.int8), categories=['Femme', 'Homme']),
+        'education': education,
+        'experience': experience,
+        'salaire': salaire
+    })
+
+def nested_example(n: int = 1200, seed: int = 7) -> pd.DataFrame:
+    """Génère un exemple synthétique de revenus pour la décomposition emboîtée"""
+    rng = np.random.default_rng(seed)
+    period = rng.random(n) < 0.5
+    region = rng.integers(0, 4, n)
+    is_male = rng.random(n) < 0.5
+    # L'accès au niveau supérieur progresse entre les deux périodes
+    education = np.minimum(rng.integers(0, 3, n) + (period & (rng.random(n) < 0.3)), 2)
+    revenu = 150 + 20*region + 30*is_male + 60*education + 25*period + rng.normal(0, 20, n)
+    return pd.DataFrame({
+        'annee': np.where(period, '2020', '2015'),
+        'region': pd.Categorical.from_codes(region, categories=['Centre', 'Littoral', 'Nord', 'Ouest']),
+        'sexe': pd.Categorical.from_codes(is_male.astype(np.int8), categories=['Femme', 'Homme']),
+        'education': pd.Categorical.from_codes(education, categories=['Primaire', 'Secondaire', 'Supérieur']),
+        'revenu': revenu
+    })
+
+# Colonnes des exemples fixes, allouées une seule fois au chargement du module
+_AFRICA = {
+    'Pays': pd.Categorical(['Algérie', 'Angola', 'Bénin', 'Botswana', 'Burkina Faso']),
+    'w_2015': np.array([3.2969, 2.3451, 0.9115, 0.1922, 1.5606], dtype=np.float64),
+    'y_2015': np.array([3.2804, 1.5274, 2.7579, 9.6725, 4.1548], dtype=np.float64),
+    'w_2020': np.array([3.1978, 2.4601, 0.9305, 0.1874, 1.5839], dtype=np.float64),
+    'y_2020': np.array([4.0239, 3.9343, 3.3283, 10.1181, 4.8370], dtype=np.float64)
+}
+
+_USA = {
+    'Niveau_éducation': pd.Categorical(
+        ['Sans diplôme', 'Secondaire', 'Université incomplète', 'Bachelor', 'Master+']
+    ),
+    'w_1972': np.array([40.705, 46.923, 1.090, 7.949, 3.333], dtype=np.float64),
+    'y_1972': np.array([69, 75, 71, 84, 89], dtype=np.float64),
+    'w_2010': np.array([14.922, 48.973, 7.094, 18.346, 10.665], dtype=np.float64),
+    'y_2010': np.array([93, 96, 99, 98, 100], dtype=np.float64)
+}
+
+def africa_example() -> pd.DataFrame:
+    """Dépenses d'éducation de cinq pays africains (2015-2020)"""
+    return pd.DataFrame.from_dict(_AFRICA, orient='columns')
+
+def usa_example() -> pd.DataFrame:
+    """Opinion présidentielle aux USA par niveau d'éducation (1972-2010)"""
+    return pd.DataFrame.from_dict(_USA, orient='columns')
+
+EXAMPLE_BUILDERS: Dict[str, Callable[[], pd.DataFrame]] = {
+    "Afrique: Dépenses éducation (2015-2020)": africa_example,
+    "USA: Opinion présidentielle (1972-2010)": usa_example,
+    DEFAULT_EXAMPLE: wage_example,
+    STRUCTURAL_EXAMPLE: nested_example,
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+Classes de repli utilisées lorsque les modules d'analyse ne peuvent pas être importés
+"""
+
+# Classes factices minimales pour éviter le crash si modules manquants
+class DemographicDecomposition:
+    def analyze(self, *args, **kwargs): return {"error": "Module non disponible"}
+class MathematicalDecomposition: pass
+class RegressionDecomposition: pass
+class StructuralDecomposition: pass
+class TableGenerator:
+    @staticmethod
+    def create_detailed_table(*args, **kwargs):
+        import plotly.graph_objects as go
+        return go.Figure()
+class ReportGenerator: pass
\ No newline at end of file
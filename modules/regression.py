@@ -1,272 +1,300 @@
-"""
-Module de décomposition de régression
-Implémente les méthodes Oaxaca-Blinder et extensions
-"""
-
-import pandas as pd
-import numpy as np
-import statsmodels.api as sm
-import statsmodels.formula.api as smf
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-import warnings
-
-@dataclass
-class RegressionResult:
-    """Structure pour les résultats de régression"""
-    coefficients: Dict
-    r_squared: float
-    n_observations: int
-    std_errors: Dict
-    model: any
-
-class RegressionDecomposition:
-    """
-    Classe pour la décomposition de régression (Oaxaca-Blinder et extensions)
-    """
-    
-    def __init__(self):
-        self.methods = ['oaxaca', 'oaxaca_reverse', 'cotton', 'neumark']
-    
-    def oaxaca_blinder(self, df: pd.DataFrame, outcome: str, predictors: List[str], 
-                       group_var: str, group1: str = None, group2: str = None,
-                       method: str = 'oaxaca') -> Dict:
-        """
-        Décomposition Oaxaca-Blinder des écarts entre groupes
-        
-        Args:
-            df: DataFrame avec les données
-            outcome: Variable dépendante
-            predictors: Liste des variables indépendantes
-            group_var: Variable de groupe (ex: 'gender')
-            group1, group2: Valeurs des deux groupes à comparer
-            method: 'oaxaca', 'oaxaca_reverse', 'cotton', 'neumark'
-            
-        Returns:
-            Résultats de la décomposition
-        """
-        # Validation
-        if group1 is None or group2 is None:
-            groups = df[group_var].unique()
-            if len(groups) != 2:
-                raise ValueError("La variable de groupe doit avoir exactement 2 catégories")
-            group1, group2 = groups[0], groups[1]
-        
-        # Séparation des groupes
-        group1_data = df[df[group_var] == group1].copy()
-        group2_data = df[df[group_var] == group2].copy()
-        
-        # Régressions séparées
-        model1 = self._run_regression(group1_data, outcome, predictors)
-        model2 = self._run_regression(group2_data, outcome, predictors)
-        
-        # Moyennes des variables
-        X1_mean = group1_data[predictors].mean().values
-        X2_mean = group2_data[predictors].mean().values
-        
-        # Coefficients
-        β1 = model1.coefficients.get('coef', {})
-        β2 = model2.coefficients.get('coef', {})
-        
-        # Intercepts
-        α1 = β1.get('Intercept', 0)
-        α2 = β2.get('Intercept', 0)
-        
-        # Différence totale
-        Y1_mean = group1_data[outcome].mean()
-        Y2_mean = group2_data[outcome].mean()
-        delta_Y = Y2_mean - Y1_mean
-        
-        # Décomposition selon la méthode
-        if method == 'oaxaca':
-            # Méthode standard (groupe 1 comme référence)
-            explained = np.dot((X2_mean - X1_mean), list(β1.values())[1:])  # Exclure l'intercept
-            unexplained = α2 - α1 + np.dot(X2_mean, np.array(list(β2.values())[1:]) - np.array(list(β1.values())[1:]))
-        elif method == 'oaxaca_reverse':
-            # Méthode inverse (groupe 2 comme référence)
-            explained = np.dot((X2_mean - X1_mean), list(β2.values())[1:])
-            unexplained = α2 - α1 + np.dot(X1_mean, np.array(list(β2.values())[1:]) - np.array(list(β1.values())[1:]))
-        elif method == 'cotton':
-            # Méthode de Cotton (moyenne pondérée)
-            n1 = len(group1_data)
-            n2 = len(group2_data)
-            β_star = (n1 * np.array(list(β1.values())[1:]) + n2 * np.array(list(β2.values())[1:])) / (n1 + n2)
-            explained = np.dot((X2_mean - X1_mean), β_star)
-            unexplained = (α2 - α1) + np.dot(X1_mean, np.array(list(β2.values())[1:]) - β_star) + \
-                         np.dot(X2_mean, β_star - np.array(list(β1.values())[1:]))
-        elif method == 'neumark':
-            # Méthode de Neumark (pooled regression)
-            pooled_data = pd.concat([group1_data, group2_data])
-            pooled_model = self._run_regression(pooled_data, outcome, predictors + [group_var])
-            β_pooled = pooled_model.coefficients.get('coef', {})
-            β_star = np.array(list(β_pooled.values())[1:-1])  # Exclure intercept et group_var
-            
-            explained = np.dot((X2_mean - X1_mean), β_star)
-            unexplained = (α2 - α1) + np.dot(X1_mean, np.array(list(β2.values())[1:]) - β_star) + \
-                         np.dot(X2_mean, β_star - np.array(list(β1.values())[1:]))
-        else:
-            raise ValueError(f"Méthode '{method}' non reconnue")
-        
-        # Contributions détaillées par variable
-        detailed_contributions = {}
-        for i, pred in enumerate(predictors):
-            if method == 'oaxaca':
-                detailed_contributions[pred] = {
-                    'explained': (X2_mean[i] - X1_mean[i]) * β1.get(pred, 0),
-                    'unexplained': X2_mean[i] * (β2.get(pred, 0) - β1.get(pred, 0))
-                }
-        
-        return {
-            'method': method,
-            'groups': {'group1': group1, 'group2': group2},
-            'means': {
-                group1: {'Y': Y1_mean, 'X': dict(zip(predictors, X1_mean))},
-                group2: {'Y': Y2_mean, 'X': dict(zip(predictors, X2_mean))}
-            },
-            'regression_results': {
-                group1: model1.coefficients,
-                group2: model2.coefficients
-            },
-            'decomposition': {
-                'total_difference': delta_Y,
-                'explained_difference': explained,
-                'unexplained_difference': unexplained,
-                'explained_percent': (explained / delta_Y * 100) if delta_Y != 0 else 0,
-                'unexplained_percent': (unexplained / delta_Y * 100) if delta_Y != 0 else 0
-            },
-            'detailed_contributions': detailed_contributions,
-            'interpretation': {
-                'explained': "Différence due aux caractéristiques observables (capital humain, expérience, etc.)",
-                'unexplained': "Différence non expliquée (discrimination, effets non observés)"
-            }
-        }
-    
-    def time_decomposition(self, df: pd.DataFrame, outcome: str, predictors: List[str],
-                           time_var: str, time1: str, time2: str) -> Dict:
-        """
-        Décomposition du changement dans le temps
-        
-        Args:
-            df: DataFrame avec données panel ou répétées
-            outcome: Variable dépendante
-            predictors: Variables indépendantes
-            time_var: Variable temporelle
-            time1, time2: Périodes à comparer
-            
-        Returns:
-            Résultats de la décomposition temporelle
-        """
-        # Séparation par période
-        period1_data = df[df[time_var] == time1].copy()
-        period2_data = df[df[time_var] == time2].copy()
-        
-        # Régressions par période
-        model1 = self._run_regression(period1_data, outcome, predictors)
-        model2 = self._run_regression(period2_data, outcome, predictors)
-        
-        # Moyennes
-        X1_mean = period1_data[predictors].mean().values
-        X2_mean = period2_data[predictors].mean().values
-        
-        # Coefficients
-        β1 = model1.coefficients.get('coef', {})
-        β2 = model2.coefficients.get('coef', {})
-        
-        # Intercepts
-        α1 = β1.get('Intercept', 0)
-        α2 = β2.get('Intercept', 0)
-        
-        # Changement total
-        Y1_mean = period1_data[outcome].mean()
-        Y2_mean = period2_data[outcome].mean()
-        delta_Y = Y2_mean - Y1_mean
-        
-        # Décomposition à trois voies (Juhn-Murphy-Pierce)
-        # ΔY = Δα + β̄ΔX + X̄Δβ
-        β_bar = (np.array(list(β1.values())[1:]) + np.array(list(β2.values())[1:])) / 2
-        X_bar = (X1_mean + X2_mean) / 2
-        
-        effect_intercept = α2 - α1
-        effect_coefficients = np.dot(X_bar, np.array(list(β2.values())[1:]) - np.array(list(β1.values())[1:]))
-        effect_endowments = np.dot(β_bar, X2_mean - X1_mean)
-        
-        # Vérification
-        total_effect = effect_intercept + effect_coefficients + effect_endowments
-        
-        return {
-            'periods': {'period1': time1, 'period2': time2},
-            'means': {
-                time1: {'Y': Y1_mean, 'X': dict(zip(predictors, X1_mean))},
-                time2: {'Y': Y2_mean, 'X': dict(zip(predictors, X2_mean))}
-            },
-            'decomposition': {
-                'total_change': delta_Y,
-                'intercept_effect': effect_intercept,
-                'coefficient_effect': effect_coefficients,
-                'endowment_effect': effect_endowments,
-                'contributions': {
-                    'intercept': (effect_intercept / delta_Y * 100) if delta_Y != 0 else 0,
-                    'coefficients': (effect_coefficients / delta_Y * 100) if delta_Y != 0 else 0,
-                    'endowments': (effect_endowments / delta_Y * 100) if delta_Y != 0 else 0
-                }
-            },
-            'interpretation': {
-                'intercept': "Changement dans la valeur de base (constante)",
-                'coefficients': "Changement dans les rendements (pentes)",
-                'endowments': "Changement dans les caractéristiques"
-            }
-        }
-    
-    def _run_regression(self, data: pd.DataFrame, outcome: str, predictors: List[str]) -> RegressionResult:
-        """Exécute une régression OLS"""
-        try:
-            X = sm.add_constant(data[predictors])
-            y = data[outcome]
-            
-            model = sm.OLS(y, X).fit()
-            
-            return RegressionResult(
-                coefficients={'coef': dict(zip(['Intercept'] + predictors, model.params)),
-                             'pvalues': dict(zip(['Intercept'] + predictors, model.pvalues))},
-                r_squared=model.rsquared,
-                n_observations=model.nobs,
-                std_errors=dict(zip(['Intercept'] + predictors, model.bse)),
-                model=model
-            )
-        except Exception as e:
-            warnings.warn(f"Erreur dans la régression: {str(e)}")
-            # Fallback: coefficients naïfs
-            coefs = {'Intercept': y.mean()}
-            for pred in predictors:
-                if len(data) > 1:
-                    coefs[pred] = np.corrcoef(data[pred], y)[0,1] * (y.std() / data[pred].std())
-                else:
-                    coefs[pred] = 0
-            
-            return RegressionResult(
-                coefficients={'coef': coefs, 'pvalues': {k: 0.5 for k in coefs}},
-                r_squared=0,
-                n_observations=len(data),
-                std_errors={k: 0 for k in coefs},
-                model=None
-            )
-    
-    def detailed_decomposition(self, df: pd.DataFrame, outcome: str, 
-                               categorical_vars: List[str], continuous_vars: List[str],
-                               group_var: str, group1: str, group2: str) -> Dict:
-        """
-        Décomposition détaillée avec variables catégorielles et continues
-        """
-        # Cette méthode implémente la décomposition détaillée de Yun (2004)
-        # Pour des raisons de complexité, c'est une version simplifiée
-        pass
-
-# Extension pour les modèles non-linéaires
-class NonlinearDecomposition:
-    """Décomposition pour modèles non-linéaires (logit, probit, etc.)"""
-    
-    @staticmethod
-    def decomposition_logit(df, outcome, predictors, group_var, group1, group2):
-        """Décomposition pour modèle logit"""
-        # Implémentation basée sur Fairlie (2005)
+"""
+Module de décomposition de régression
+Implémente les méthodes Oaxaca-Blinder et extensions
+"""
+
+import pandas as pd
+import numpy as np
+import statsmodels.api as sm
+import statsmodels.formula.api as smf
+from typing import Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass
+import warnings
+import threading
+
+@dataclass
+class RegressionResult:
+    """Structure pour les résultats de régression"""
+    coefficients: Dict
+    r_squared: float
+    n_observations: int
+    std_errors: Dict
+    model: any
+
+class RegressionDecomposition:
+    """
+    Classe pour la décomposition de régression (Oaxaca-Blinder et extensions)
+    """
+    
+    # Nombre maximal de régressions conservées en mémoire
+    MAX_CACHED_FITS = 32
+    
+    def __init__(self):
+        self.methods = ['oaxaca', 'oaxaca_reverse', 'cotton', 'neumark']
+        self._fit_cache = {}
+        # Instance partagée entre les sessions : accès au cache sous verrou
+        self._fit_lock = threading.Lock()
+    
+    def oaxaca_blinder(self, df: pd.DataFrame, outcome: str, predictors: List[str], 
+                       group_var: str, group1: str = None, group2: str = None,
+                       method: str = 'oaxaca') -> Dict:
+        """
+        Décomposition Oaxaca-Blinder des écarts entre groupes
+        
+        Args:
+            df: DataFrame avec les données
+            outcome: Variable dépendante
+            predictors: Liste des variables indépendantes
+            group_var: Variable de groupe (ex: 'gender')
+            group1, group2: Valeurs des deux groupes à comparer
+            method: 'oaxaca', 'oaxaca_reverse', 'cotton', 'neumark'
+            
+        Returns:
+            Résultats de la décomposition
+        """
+        # Validation
+        if group1 is None or group2 is None:
+            groups = df[group_var].unique()
+            if len(groups) != 2:
+                raise ValueError("La variable de groupe doit avoir exactement 2 catégories")
+            group1, group2 = groups[0], groups[1]
+        
+        # Séparation des groupes : masques calculés une fois sur le tableau NumPy ;
+        # l'indexation booléenne produit déjà des cadres distincts (pas de .copy())
+        g = df[group_var].to_numpy()
+        mask1 = g == group1
+        mask2 = g == group2
+        group1_data = df[mask1]
+        group2_data = df[mask2]
+        
+        # Régressions séparées
+        model1 = self._run_regression(group1_data, outcome, predictors)
+        model2 = self._run_regression(group2_data, outcome, predictors)
+        
+        # Moyennes des variables
+        X1_mean = group1_data[predictors].mean().values
+        X2_mean = group2_data[predictors].mean().values
+        
+        # Coefficients
+        β1 = model1.coefficients.get('coef', {})
+        β2 = model2.coefficients.get('coef', {})
+        
+        # Intercepts
+        α1 = β1.get('Intercept', 0)
+        α2 = β2.get('Intercept', 0)
+        
+        # Différence totale
+        Y1_mean = group1_data[outcome].mean()
+        Y2_mean = group2_data[outcome].mean()
+        delta_Y = Y2_mean - Y1_mean
+        
+        # Décomposition selon la méthode
+        if method == 'oaxaca':
+            # Méthode standard (groupe 1 comme référence)
+            explained = np.dot((X2_mean - X1_mean), list(β1.values())[1:])  # Exclure l'intercept
+            unexplained = α2 - α1 + np.dot(X2_mean, np.array(list(β2.values())[1:]) - np.array(list(β1.values())[1:]))
+        elif method == 'oaxaca_reverse':
+            # Méthode inverse (groupe 2 comme référence)
+            explained = np.dot((X2_mean - X1_mean), list(β2.values())[1:])
+            unexplained = α2 - α1 + np.dot(X1_mean, np.array(list(β2.values())[1:]) - np.array(list(β1.values())[1:]))
+        elif method == 'cotton':
+            # Méthode de Cotton (moyenne pondérée)
+            n1 = len(group1_data)
+            n2 = len(group2_data)
+            β_star = (n1 * np.array(list(β1.values())[1:]) + n2 * np.array(list(β2.values())[1:])) / (n1 + n2)
+            explained = np.dot((X2_mean - X1_mean), β_star)
+            unexplained = (α2 - α1) + np.dot(X1_mean, np.array(list(β2.values())[1:]) - β_star) + \
+                         np.dot(X2_mean, β_star - np.array(list(β1.values())[1:]))
+        elif method == 'neumark':
+            # Méthode de Neumark (pooled regression)
+            pooled_data = df[mask1 | mask2]
+            pooled_model = self._run_regression(pooled_data, outcome, predictors + [group_var])
+            β_pooled = pooled_model.coefficients.get('coef', {})
+            β_star = np.array(list(β_pooled.values())[1:-1])  # Exclure intercept et group_var
+            
+            explained = np.dot((X2_mean - X1_mean), β_star)
+            unexplained = (α2 - α1) + np.dot(X1_mean, np.array(list(β2.values())[1:]) - β_star) + \
+                         np.dot(X2_mean, β_star - np.array(list(β1.values())[1:]))
+        else:
+            raise ValueError(f"Méthode '{method}' non reconnue")
+        
+        # Contributions détaillées par variable
+        detailed_contributions = {}
+        for i, pred in enumerate(predictors):
+            if method == 'oaxaca':
+                detailed_contributions[pred] = {
+                    'explained': (X2_mean[i] - X1_mean[i]) * β1.get(pred, 0),
+                    'unexplained': X2_mean[i] * (β2.get(pred, 0) - β1.get(pred, 0))
+                }
+        
+        return {
+            'method': method,
+            'groups': {'group1': group1, 'group2': group2},
+            'means': {
+                group1: {'Y': Y1_mean, 'X': dict(zip(predictors, X1_mean))},
+                group2: {'Y': Y2_mean, 'X': dict(zip(predictors, X2_mean))}
+            },
+            'regression_results': {
+                group1: model1.coefficients,
+                group2: model2.coefficients
+            },
+            'decomposition': {
+                'total_difference': delta_Y,
+                'explained_difference': explained,
+                'unexplained_difference': unexplained,
+                'explained_percent': (explained / delta_Y * 100) if delta_Y != 0 else 0,
+                'unexplained_percent': (unexplained / delta_Y * 100) if delta_Y != 0 else 0
+            },
+            'detailed_contributions': detailed_contributions,
+            'interpretation': {
+                'explained': "Différence due aux caractéristiques observables (capital humain, expérience, etc.)",
+                'unexplained': "Différence non expliquée (discrimination, effets non observés)"
+            }
+        }
+    
+    def time_decomposition(self, df: pd.DataFrame, outcome: str, predictors: List[str],
+                           time_var: str, time1: str, time2: str) -> Dict:
+        """
+        Décomposition du changement dans le temps
+        
+        Args:
+            df: DataFrame avec données panel ou répétées
+            outcome: Variable dépendante
+            predictors: Variables indépendantes
+            time_var: Variable temporelle
+            time1, time2: Périodes à comparer
+            
+        Returns:
+            Résultats de la décomposition temporelle
+        """
+        # Séparation par période
+        time_col = df[time_var]
+        period1_data = df[time_col == time1]
+        period2_data = df[time_col == time2]
+        
+        # Régressions par période
+        model1 = self._run_regression(period1_data, outcome, predictors)
+        model2 = self._run_regression(period2_data, outcome, predictors)
+        
+        # Moyennes
+        X1_mean = period1_data[predictors].mean().values
+        X2_mean = period2_data[predictors].mean().values
+        
+        # Coefficients
+        β1 = model1.coefficients.get('coef', {})
+        β2 = model2.coefficients.get('coef', {})
+        
+        # Intercepts
+        α1 = β1.get('Intercept', 0)
+        α2 = β2.get('Intercept', 0)
+        
+        # Changement total
+        Y1_mean = period1_data[outcome].mean()
+        Y2_mean = period2_data[outcome].mean()
+        delta_Y = Y2_mean - Y1_mean
+        
+        # Décomposition à trois voies (Juhn-Murphy-Pierce)
+        # ΔY = Δα + β̄ΔX + X̄Δβ
+        β_bar = (np.array(list(β1.values())[1:]) + np.array(list(β2.values())[1:])) / 2
+        X_bar = (X1_mean + X2_mean) / 2
+        
+        effect_intercept = α2 - α1
+        effect_coefficients = np.dot(X_bar, np.array(list(β2.values())[1:]) - np.array(list(β1.values())[1:]))
+        effect_endowments = np.dot(β_bar, X2_mean - X1_mean)
+        
+        # Vérification
+        total_effect = effect_intercept + effect_coefficients + effect_endowments
+        
+        return {
+            'periods': {'period1': time1, 'period2': time2},
+            'means': {
+                time1: {'Y': Y1_mean, 'X': dict(zip(predictors, X1_mean))},
+                time2: {'Y': Y2_mean, 'X': dict(zip(predictors, X2_mean))}
+            },
+            'decomposition': {
+                'total_change': delta_Y,
+                'intercept_effect': effect_intercept,
+                'coefficient_effect': effect_coefficients,
+                'endowment_effect': effect_endowments,
+                'contributions': {
+                    'intercept': (effect_intercept / delta_Y * 100) if delta_Y != 0 else 0,
+                    'coefficients': (effect_coefficients / delta_Y * 100) if delta_Y != 0 else 0,
+                    'endowments': (effect_endowments / delta_Y * 100) if delta_Y != 0 else 0
+                }
+            },
+            'interpretation': {
+                'intercept': "Changement dans la valeur de base (constante)",
+                'coefficients': "Changement dans les rendements (pentes)",
+                'endowments': "Changement dans les caractéristiques"
+            }
+        }
+    
+    def _run_regression(self, data: pd.DataFrame, outcome: str, predictors: List[str]) -> RegressionResult:
+        """Exécute une régression OLS (mise en cache sur l'empreinte des données)"""
+        columns = [outcome] + list(predictors)
+        key = (tuple(columns), len(data),
+               int(pd.util.hash_pandas_object(data[columns], index=False).sum()))
+        with self._fit_lock:
+            cached = self._fit_cache.get(key)
+        if cached is not None:
+            return cached
+        # Ajustement hors verrou : les autres sessions ne sont pas bloquées
+        fitted = self._fit_ols(data, outcome, predictors)
+        with self._fit_lock:
+            if len(self._fit_cache) >= self.MAX_CACHED_FITS:
+                self._fit_cache.clear()
+            return self._fit_cache.setdefault(key, fitted)
+    
+    def _fit_ols(self, data: pd.DataFrame, outcome: str, predictors: List[str]) -> RegressionResult:
+        """Ajuste le modèle OLS"""
+        try:
+            X = sm.add_constant(data[predictors])
+            y = data[outcome]
+            
+            model = sm.OLS(y, X).fit()
+            
+            return RegressionResult(
+                coefficients={'coef': dict(zip(['Intercept'] + predictors, model.params)),
+                             'pvalues': dict(zip(['Intercept'] + predictors, model.pvalues))},
+                r_squared=model.rsquared,
+                n_observations=model.nobs,
+                std_errors=dict(zip(['Intercept'] + predictors, model.bse)),
+                model=model
+            )
+        except Exception as e:
+            warnings.warn(f"Erreur dans la régression: {str(e)}")
+            # Fallback: coefficients naïfs
+            coefs = {'Intercept': y.mean()}
+            for pred in predictors:
+                if len(data) > 1:
+                    coefs[pred] = np.corrcoef(data[pred], y)[0,1] * (y.std() / data[pred].std())
+                else:
+                    coefs[pred] = 0
+            
+            return RegressionResult(
+                coefficients={'coef': coefs, 'pvalues': {k: 0.5 for k in coefs}},
+                r_squared=0,
+                n_observations=len(data),
+                std_errors={k: 0 for k in coefs},
+                model=None
+            )
+    
+    def detailed_decomposition(self, df: pd.DataFrame, outcome: str, 
+                               categorical_vars: List[str], continuous_vars: List[str],
+                               group_var: str, group1: str, group2: str) -> Dict:
+        """
+        Décomposition détaillée avec variables catégorielles et continues
+        """
+        # Cette méthode implémente la décomposition détaillée de Yun (2004)
+        # Pour des raisons de complexité, c'est une version simplifiée
+        pass
+
+# Extension pour les modèles non-linéaires
+class NonlinearDecomposition:
+    """Décomposition pour modèles non-linéaires (logit, probit, etc.)"""
+    
+    @staticmethod
+    def decomposition_logit(df, outcome, predictors, group_var, group1, group2):
+        """Décomposition pour modèle logit"""
+        # Implémentation basée sur Fairlie (2005)
         pass
\ No newline at end of file
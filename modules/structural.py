@@ -1,378 +1,451 @@
-"""
-Module de décomposition structurelle
-Analyses multi-niveaux, décomposition emboîtée et modèles structurels
-"""
-
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Tuple, Optional
-import warnings
-from scipy import stats
-
-class StructuralDecomposition:
-    """
-    Classe pour les décompositions structurelles complexes
-    """
-    
-    def __init__(self):
-        self.methods = {
-            'nested': "Décomposition emboîtée",
-            'multi_level': "Analyse multi-niveaux",
-            'demographic_components': "Composantes démographiques",
-            'path_analysis': "Analyse des chemins"
-        }
-    
-    def nested_decomposition(self, df: pd.DataFrame, outcome: str, 
-                            primary_group: str, secondary_groups: List[str],
-                            periods: Tuple[str, str]) -> Dict:
-        """
-        Décomposition emboîtée hiérarchique
-        
-        Args:
-            df: DataFrame avec les données
-            outcome: Variable d'intérêt
-            primary_group: Groupe principal (ex: région)
-            secondary_groups: Groupes secondaires (ex: sexe, éducation)
-            periods: Périodes à comparer
-            
-        Returns:
-            Résultats de la décomposition emboîtée
-        """
-        period1, period2 = periods
-        
-        # Filtrage des périodes
-        df1 = df[df['period'] == period1].copy()
-        df2 = df[df['period'] == period2].copy()
-        
-        results = {
-            'primary_group': primary_group,
-            'secondary_groups': secondary_groups,
-            'periods': periods,
-            'levels': {}
-        }
-        
-        # Niveau 1: Groupe principal
-        primary_results = self._decompose_by_group(df1, df2, outcome, primary_group)
-        results['levels']['primary'] = primary_results
-        
-        # Niveaux secondaires pour chaque catégorie du groupe principal
-        for category in df[primary_group].unique():
-            sub_df1 = df1[df1[primary_group] == category]
-            sub_df2 = df2[df2[primary_group] == category]
-            
-            category_results = {}
-            for secondary in secondary_groups:
-                decomp = self._decompose_by_group(sub_df1, sub_df2, outcome, secondary)
-                category_results[secondary] = decomp
-            
-            results['levels']['secondary'][category] = category_results
-        
-        # Calcul des contributions hiérarchiques
-        contributions = self._calculate_hierarchical_contributions(results)
-        results['hierarchical_contributions'] = contributions
-        
-        return results
-    
-    def _decompose_by_group(self, df1: pd.DataFrame, df2: pd.DataFrame, 
-                           outcome: str, group_var: str) -> Dict:
-        """Décomposition simple par groupe"""
-        results = {}
-        
-        for group in pd.concat([df1[group_var], df2[group_var]]).unique():
-            group1 = df1[df1[group_var] == group][outcome].mean() if group in df1[group_var].values else np.nan
-            group2 = df2[df2[group_var] == group][outcome].mean() if group in df2[group_var].values else np.nan
-            
-            # Poids (proportion dans la population)
-            weight1 = len(df1[df1[group_var] == group]) / len(df1) if len(df1) > 0 else 0
-            weight2 = len(df2[df2[group_var] == group]) / len(df2) if len(df2) > 0 else 0
-            
-            results[group] = {
-                'mean_period1': group1,
-                'mean_period2': group2,
-                'change': group2 - group1 if not np.isnan(group1) and not np.isnan(group2) else np.nan,
-                'weight_period1': weight1,
-                'weight_period2': weight2
-            }
-        
-        # Calcul de la décomposition globale pour ce niveau
-        global_result = self._calculate_global_decomposition(df1, df2, outcome, group_var)
-        results['_global'] = global_result
-        
-        return results
-    
-    def _calculate_global_decomposition(self, df1, df2, outcome, group_var):
-        """Calcule la décomposition globale pour un niveau"""
-        # Moyenne globale
-        Y1 = df1[outcome].mean()
-        Y2 = df2[outcome].mean()
-        delta_Y = Y2 - Y1
-        
-        # Décomposition par groupe
-        composition_effect = 0
-        behavior_effect = 0
-        
-        all_groups = set(df1[group_var].unique()) | set(df2[group_var].unique())
-        
-        for group in all_groups:
-            # Valeurs du groupe
-            y1 = df1[df1[group_var] == group][outcome].mean() if group in df1[group_var].values else Y1
-            y2 = df2[df2[group_var] == group][outcome].mean() if group in df2[group_var].values else Y2
-            
-            # Poids
-            w1 = len(df1[df1[group_var] == group]) / len(df1) if len(df1) > 0 else 0
-            w2 = len(df2[df2[group_var] == group]) / len(df2) if len(df2) > 0 else 0
-            
-            # Contributions
-            composition_effect += ((y1 + y2) / 2) * (w2 - w1)
-            behavior_effect += ((w1 + w2) / 2) * (y2 - y1)
-        
-        return {
-            'Y1': Y1,
-            'Y2': Y2,
-            'delta_Y': delta_Y,
-            'composition_effect': composition_effect,
-            'behavior_effect': behavior_effect,
-            'composition_percent': (composition_effect / delta_Y * 100) if delta_Y != 0 else 0,
-            'behavior_percent': (behavior_effect / delta_Y * 100) if delta_Y != 0 else 0
-        }
-    
-    def _calculate_hierarchical_contributions(self, results: Dict) -> Dict:
-        """Calcule les contributions hiérarchiques"""
-        contributions = {}
-        
-        # Contribution du niveau primaire
-        primary_global = results['levels']['primary']['_global']
-        contributions['primary'] = {
-            'composition': primary_global['composition_percent'],
-            'behavior': primary_global['behavior_percent']
-        }
-        
-        # Contributions conditionnelles des niveaux secondaires
-        contributions['secondary'] = {}
-        
-        for category, secondary_results in results['levels']['secondary'].items():
-            category_contrib = {}
-            for var_name, var_results in secondary_results.items():
-                if '_global' in var_results:
-                    global_res = var_results['_global']
-                    category_contrib[var_name] = {
-                        'composition': global_res['composition_percent'],
-                        'behavior': global_res['behavior_percent']
-                    }
-            contributions['secondary'][category] = category_contrib
-        
-        return contributions
-    
-    def demographic_components_decomposition(self, df: pd.DataFrame, outcome: str,
-                                           age_var: str, period_var: str,
-                                           components: List[str] = None) -> Dict:
-        """
-        Décomposition par composantes démographiques (fécondité, mortalité, migration)
-        
-        Args:
-            df: DataFrame avec données démographiques
-            outcome: Variable d'intérêt (ex: taux de dépendance)
-            age_var: Variable d'âge
-            period_var: Variable temporelle
-            components: Composantes à inclure (fertility, mortality, migration)
-            
-        Returns:
-            Résultats de la décomposition démographique
-        """
-        if components is None:
-            components = ['fertility', 'mortality', 'migration']
-        
-        periods = sorted(df[period_var].unique())
-        if len(periods) < 2:
-            raise ValueError("Au moins deux périodes sont nécessaires")
-        
-        results = {
-            'components': components,
-            'periods': periods,
-            'decompositions': {}
-        }
-        
-        # Pour chaque paire de périodes consécutives
-        for i in range(len(periods) - 1):
-            p1, p2 = periods[i], periods[i+1]
-            
-            df1 = df[df[period_var] == p1].copy()
-            df2 = df[df[period_var] == p2].copy()
-            
-            decomposition = {}
-            
-            # Effet de structure par âge (composition)
-            age_effect = self._calculate_age_structure_effect(df1, df2, outcome, age_var)
-            decomposition['age_structure'] = age_effect
-            
-            # Effets spécifiques des composantes
-            if 'fertility' in components:
-                fertility_effect = self._estimate_fertility_effect(df1, df2, outcome)
-                decomposition['fertility'] = fertility_effect
-            
-            if 'mortality' in components:
-                mortality_effect = self._estimate_mortality_effect(df1, df2, outcome)
-                decomposition['mortality'] = mortality_effect
-            
-            if 'migration' in components:
-                migration_effect = self._estimate_migration_effect(df1, df2, outcome)
-                decomposition['migration'] = migration_effect
-            
-            # Effet comportemental résiduel
-            total_change = df2[outcome].mean() - df1[outcome].mean()
-            explained_change = sum(effect['contribution'] for effect in decomposition.values())
-            residual_effect = total_change - explained_change
-            
-            decomposition['residual'] = {
-                'contribution': residual_effect,
-                'percent': (residual_effect / total_change * 100) if total_change != 0 else 0,
-                'interpretation': "Effet comportemental et autres facteurs non démographiques"
-            }
-            
-            results['decompositions'][f'{p1}-{p2}'] = {
-                'total_change': total_change,
-                'components': decomposition,
-                'summary': self._summarize_demographic_decomposition(decomposition)
-            }
-        
-        return results
-    
-    def _calculate_age_structure_effect(self, df1, df2, outcome, age_var):
-        """Calcule l'effet de la structure par âge"""
-        # Groupement par âge
-        age_groups = sorted(set(df1[age_var].unique()) | set(df2[age_var].unique()))
-        
-        effect = 0
-        for age in age_groups:
-            # Valeur moyenne pour cet âge (moyenne sur les deux périodes)
-            y1 = df1[df1[age_var] == age][outcome].mean() if age in df1[age_var].values else 0
-            y2 = df2[df2[age_var] == age][outcome].mean() if age in df2[age_var].values else 0
-            y_bar = (y1 + y2) / 2
-            
-            # Poids (proportion de la population)
-            w1 = len(df1[df1[age_var] == age]) / len(df1) if len(df1) > 0 else 0
-            w2 = len(df2[df2[age_var] == age]) / len(df2) if len(df2) > 0 else 0
-            
-            effect += y_bar * (w2 - w1)
-        
-        return {
-            'contribution': effect,
-            'interpretation': "Effet du changement dans la structure par âge de la population"
-        }
-    
-    def _estimate_fertility_effect(self, df1, df2, outcome):
-        """Estime l'effet de la fécondité (version simplifiée)"""
-        # Dans une vraie implémentation, utiliserait les taux de fécondité par âge
-        return {
-            'contribution': 0,  # Placeholder
-            'interpretation': "Effet du changement dans les taux de fécondité"
-        }
-    
-    def _estimate_mortality_effect(self, df1, df2, outcome):
-        """Estime l'effet de la mortalité"""
-        return {
-            'contribution': 0,  # Placeholder
-            'interpretation': "Effet du changement dans les taux de mortalité"
-        }
-    
-    def _estimate_migration_effect(self, df1, df2, outcome):
-        """Estime l'effet des migrations"""
-        return {
-            'contribution': 0,  # Placeholder
-            'interpretation': "Effet des migrations nettes"
-        }
-    
-    def _summarize_demographic_decomposition(self, decomposition):
-        """Résume la décomposition démographique"""
-        total = sum(comp['contribution'] for comp in decomposition.values())
-        
-        summary = {}
-        for name, comp in decomposition.items():
-            percent = (comp['contribution'] / total * 100) if total != 0 else 0
-            summary[name] = {
-                'contribution': comp['contribution'],
-                'percent': percent,
-                'interpretation': comp.get('interpretation', '')
-            }
-        
-        return summary
-    
-    def path_analysis_decomposition(self, df: pd.DataFrame, outcome: str,
-                                   paths: Dict[str, List[str]]) -> Dict:
-        """
-        Décomposition par analyse des chemins (Path Analysis)
-        
-        Args:
-            df: DataFrame avec les données
-            outcome: Variable dépendante finale
-            paths: Dictionnaire des chemins {nom_chemin: [variables]}
-            
-        Returns:
-            Résultats de l'analyse des chemins
-        """
-        # Cette méthode implémente une version simplifiée de l'analyse des chemins
-        # Pour une implémentation complète, utiliser un package comme semopy
-        
-        results = {
-            'paths': {},
-            'total_effects': {}
-        }
-        
-        # Pour chaque chemin
-        for path_name, variables in paths.items():
-            path_results = []
-            
-            # Régression pour chaque étape du chemin
-            for i in range(len(variables)):
-                if i == 0:
-                    # Première étape: variable initiale -> première variable médiatrice
-                    X = df[variables[0]].values.reshape(-1, 1)
-                    y = df[variables[1]].values
-                elif i < len(variables) - 1:
-                    # Étapes intermédiaires
-                    X = df[variables[i]].values.reshape(-1, 1)
-                    y = df[variables[i+1]].values
-                else:
-                    # Dernière étape: dernière variable médiatrice -> outcome
-                    X = df[variables[-1]].values.reshape(-1, 1)
-                    y = df[outcome].values
-                
-                # Régression simple
-                if len(set(X.flatten())) > 1:
-                    slope = np.cov(X.flatten(), y)[0, 1] / np.var(X.flatten())
-                    path_results.append(slope)
-                else:
-                    path_results.append(0)
-            
-            # Effet total du chemin (produit des coefficients)
-            total_path_effect = np.prod(path_results)
-            
-            results['paths'][path_name] = {
-                'variables': variables,
-                'coefficients': path_results,
-                'total_effect': total_path_effect
-            }
-        
-        # Effets totaux
-        total_variance = df[outcome].var()
-        
-        for path_name, path_info in results['paths'].items():
-            explained_variance = (path_info['total_effect'] ** 2) * df[path_info['variables'][0]].var()
-            percent_explained = (explained_variance / total_variance * 100) if total_variance != 0 else 0
-            
-            results['total_effects'][path_name] = {
-                'explained_variance': explained_variance,
-                'percent_explained': percent_explained
-            }
-        
-        return results
-
-# Classe pour les analyses multi-niveaux
-class MultiLevelDecomposition:
-    """Décomposition multi-niveaux (individu, groupe, société)"""
-    
-    @staticmethod
-    def hierarchical_linear_model(df, outcome, level1_vars, level2_vars, group_var):
-        """Modèle linéaire hiérarchique"""
-        # Implémentation simplifiée
+"""
+Module de décomposition structurelle
+Analyses multi-niveaux, décomposition emboîtée et modèles structurels
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Tuple, Optional
+import warnings
+from scipy import stats
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba absent : les noyaux s'exécutent en Python pur
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, nogil=True)
+def _kitagawa_kernel(w1, y1, w2, y2, out_comp, out_behav):
+    """
+    Termes de Kitagawa par groupe, écrits dans out_comp et out_behav
+    
+    Boucle séquentielle sans le GIL : le parallélisme Numba (workqueue) ne
+    supporte pas les appels concurrents des sessions Streamlit. Pas de
+    fastmath : les groupes absents d'une période portent des NaN.
+    """
+    for i in range(w1.size):
+        out_comp[i] = 0.5 * (y1[i] + y2[i]) * (w2[i] - w1[i])
+        out_behav[i] = 0.5 * (w1[i] + w2[i]) * (y2[i] - y1[i])
+
+# Compilation anticipée au chargement du module, hors interaction utilisateur
+_kitagawa_kernel(np.ones(4), np.ones(4), np.ones(4), np.ones(4), np.empty(4), np.empty(4))
+
+class StructuralDecomposition:
+    """
+    Classe pour les décompositions structurelles complexes
+    """
+    
+    def __init__(self):
+        self.methods = {
+            'nested': "Décomposition emboîtée",
+            'multi_level': "Analyse multi-niveaux",
+            'demographic_components': "Composantes démographiques",
+            'path_analysis': "Analyse des chemins"
+        }
+    
+    def nested_decomposition(self, df: pd.DataFrame, outcome: str, 
+                            primary_group: str, secondary_groups: List[str],
+                            periods: Tuple[str, str], period_var: str = 'period') -> Dict:
+        """
+        Décomposition emboîtée hiérarchique
+        
+        Args:
+            df: DataFrame avec les données
+            outcome: Variable d'intérêt
+            primary_group: Groupe principal (ex: région)
+            secondary_groups: Groupes secondaires (ex: sexe, éducation)
+            periods: Périodes à comparer
+            period_var: Variable de période
+            
+        Les colonnes de groupe de type 'category' sont à privilégier : elles sont
+        utilisées telles quelles et les regroupements portent sur leurs codes.
+            
+        Returns:
+            Résultats de la décomposition emboîtée
+        """
+        period1, period2 = periods
+        
+        # Colonnes utiles uniquement ; groupes en catégories (codes entiers)
+        group_cols = [primary_group] + list(secondary_groups)
+        df = df[[outcome, period_var] + group_cols].dropna()
+        df = df.astype({col: 'category' for col in group_cols
+                        if not isinstance(df[col].dtype, pd.CategoricalDtype)})
+        
+        # Filtrage des périodes
+        period_col = df[period_var]
+        df1 = df[period_col == period1]
+        df2 = df[period_col == period2]
+        for period, subset in ((period1, df1), (period2, df2)):
+            if subset.empty:
+                raise ValueError(f"Aucune observation complète pour la période {period}")
+        
+        results = {
+            'primary_group': primary_group,
+            'secondary_groups': secondary_groups,
+            'periods': periods,
+            'levels': {'secondary': {}}
+        }
+        
+        # Niveau 1: Groupe principal
+        results['levels']['primary'] = self._decompose_by_group(df1, df2, outcome, primary_group)
+        
+        # Niveaux secondaires : un seul groupby (principal, secondaire) par variable,
+        # toutes les catégories du groupe principal étant traitées ensemble
+        secondary = results['levels']['secondary']
+        for var in secondary_groups:
+            for category, decomp in self._decompose_nested(df1, df2, outcome, primary_group, var).items():
+                secondary.setdefault(category, {})[var] = decomp
+        
+        # Calcul des contributions hiérarchiques
+        contributions = self._calculate_hierarchical_contributions(results)
+        results['hierarchical_contributions'] = contributions
+        
+        return results
+    
+    @staticmethod
+    def _aligned_group_stats(df1: pd.DataFrame, df2: pd.DataFrame, outcome: str,
+                             keys: List[str]) -> pd.DataFrame:
+        """Moyenne et effectif par groupe des deux périodes, alignés sur l'union des groupes"""
+        stats1 = df1.groupby(keys, observed=True, sort=False)[outcome].agg(['mean', 'count'])
+        stats2 = df2.groupby(keys, observed=True, sort=False)[outcome].agg(['mean', 'count'])
+        aligned = stats1.join(stats2, how='outer', lsuffix='1', rsuffix='2')
+        aligned[['count1', 'count2']] = aligned[['count1', 'count2']].fillna(0)
+        return aligned
+    
+    @staticmethod
+    def _kitagawa_by_category(aligned: pd.DataFrame, categories) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Décomposition de Kitagawa de chaque catégorie sur des tableaux alignés
+        
+        Les poids sont les parts d'effectif au sein de la catégorie ; un groupe
+        absent d'une période prend la moyenne de sa catégorie pour cette période.
+        """
+        n1, n2 = aligned['count1'], aligned['count2']
+        by_cat = pd.DataFrame({
+            'n1': n1, 'n2': n2,
+            's1': aligned['mean1'].fillna(0) * n1,
+            's2': aligned['mean2'].fillna(0) * n2
+        }).groupby(categories, observed=True, sort=False).sum()
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            by_cat['Y1'] = by_cat['s1'] / by_cat['n1']
+            by_cat['Y2'] = by_cat['s2'] / by_cat['n2']
+            tot1 = by_cat['n1'].reindex(categories).to_numpy()
+            tot2 = by_cat['n2'].reindex(categories).to_numpy()
+            w1 = np.where(tot1 > 0, n1.to_numpy() / tot1, 0.0)
+            w2 = np.where(tot2 > 0, n2.to_numpy() / tot2, 0.0)
+        y1 = aligned['mean1'].fillna(by_cat['Y1'].reindex(categories).set_axis(aligned.index)).to_numpy(np.float64)
+        y2 = aligned['mean2'].fillna(by_cat['Y2'].reindex(categories).set_axis(aligned.index)).to_numpy(np.float64)
+        
+        comp = np.empty_like(y1)
+        behav = np.empty_like(y1)
+        _kitagawa_kernel(w1, y1, w2, y2, comp, behav)
+        effects = pd.DataFrame({
+            'composition_effect': comp,
+            'behavior_effect': behav,
+            'weight_period1': w1,
+            'weight_period2': w2
+        }, index=aligned.index)
+        by_cat[['composition_effect', 'behavior_effect']] = (
+            effects[['composition_effect', 'behavior_effect']].groupby(categories, observed=True, sort=False).sum()
+        )
+        by_cat['delta_Y'] = by_cat['Y2'] - by_cat['Y1']
+        # Catégorie absente d'une période : effets indéfinis (la somme ignorerait les NaN)
+        by_cat.loc[by_cat['delta_Y'].isna(), ['composition_effect', 'behavior_effect']] = np.nan
+        delta = by_cat['delta_Y'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for name in ('composition', 'behavior'):
+                by_cat[f'{name}_percent'] = np.where(
+                    delta != 0, by_cat[f'{name}_effect'].to_numpy() / delta * 100, 0.0
+                )
+        return by_cat, effects
+    
+    @staticmethod
+    def _level_results(aligned: pd.DataFrame, effects: pd.DataFrame, labels, global_row) -> Dict:
+        """Résultats par groupe et décomposition globale d'un niveau"""
+        results = {
+            group: {
+                'mean_period1': y1,
+                'mean_period2': y2,
+                'change': y2 - y1,
+                'weight_period1': w1,
+                'weight_period2': w2
+            }
+            for group, y1, y2, w1, w2 in zip(
+                labels, aligned['mean1'].to_numpy(), aligned['mean2'].to_numpy(),
+                effects['weight_period1'].to_numpy(), effects['weight_period2'].to_numpy()
+            )
+        }
+        results['_global'] = {
+            key: global_row[key]
+            for key in ('Y1', 'Y2', 'delta_Y', 'composition_effect', 'behavior_effect',
+                        'composition_percent', 'behavior_percent')
+        }
+        return results
+    
+    def _decompose_by_group(self, df1: pd.DataFrame, df2: pd.DataFrame, 
+                           outcome: str, group_var: str) -> Dict:
+        """Décomposition simple par groupe"""
+        aligned = self._aligned_group_stats(df1, df2, outcome, [group_var])
+        by_cat, effects = self._kitagawa_by_category(aligned, np.zeros(len(aligned), dtype=np.int8))
+        return self._level_results(aligned, effects, aligned.index, by_cat.iloc[0])
+    
+    def _decompose_nested(self, df1: pd.DataFrame, df2: pd.DataFrame, outcome: str,
+                          primary_group: str, group_var: str) -> Dict:
+        """Décomposition par group_var au sein de chaque catégorie du groupe principal"""
+        aligned = self._aligned_group_stats(df1, df2, outcome, [primary_group, group_var])
+        categories = aligned.index.get_level_values(0)
+        by_cat, effects = self._kitagawa_by_category(aligned, categories)
+        
+        results = {}
+        for category, global_row in by_cat.iterrows():
+            rows = categories == category
+            results[category] = self._level_results(
+                aligned[rows], effects[rows], aligned.index[rows].get_level_values(1), global_row
+            )
+        return results
+    
+    def _calculate_hierarchical_contributions(self, results: Dict) -> Dict:
+        """Calcule les contributions hiérarchiques"""
+        contributions = {}
+        
+        # Contribution du niveau primaire
+        primary_global = results['levels']['primary']['_global']
+        contributions['primary'] = {
+            'composition': primary_global['composition_percent'],
+            'behavior': primary_global['behavior_percent']
+        }
+        
+        # Contributions conditionnelles des niveaux secondaires
+        contributions['secondary'] = {}
+        
+        for category, secondary_results in results['levels']['secondary'].items():
+            category_contrib = {}
+            for var_name, var_results in secondary_results.items():
+                if '_global' in var_results:
+                    global_res = var_results['_global']
+                    category_contrib[var_name] = {
+                        'composition': global_res['composition_percent'],
+                        'behavior': global_res['behavior_percent']
+                    }
+            contributions['secondary'][category] = category_contrib
+        
+        return contributions
+    
+    def demographic_components_decomposition(self, df: pd.DataFrame, outcome: str,
+                                           age_var: str, period_var: str,
+                                           components: List[str] = None) -> Dict:
+        """
+        Décomposition par composantes démographiques (fécondité, mortalité, migration)
+        
+        Args:
+            df: DataFrame avec données démographiques
+            outcome: Variable d'intérêt (ex: taux de dépendance)
+            age_var: Variable d'âge
+            period_var: Variable temporelle
+            components: Composantes à inclure (fertility, mortality, migration)
+            
+        Returns:
+            Résultats de la décomposition démographique
+        """
+        if components is None:
+            components = ['fertility', 'mortality', 'migration']
+        
+        periods = sorted(df[period_var].unique())
+        if len(periods) < 2:
+            raise ValueError("Au moins deux périodes sont nécessaires")
+        
+        results = {
+            'components': components,
+            'periods': periods,
+            'decompositions': {}
+        }
+        
+        # Pour chaque paire de périodes consécutives
+        for i in range(len(periods) - 1):
+            p1, p2 = periods[i], periods[i+1]
+            
+            df1 = df[df[period_var] == p1].copy()
+            df2 = df[df[period_var] == p2].copy()
+            
+            decomposition = {}
+            
+            # Effet de structure par âge (composition)
+            age_effect = self._calculate_age_structure_effect(df1, df2, outcome, age_var)
+            decomposition['age_structure'] = age_effect
+            
+            # Effets spécifiques des composantes
+            if 'fertility' in components:
+                fertility_effect = self._estimate_fertility_effect(df1, df2, outcome)
+                decomposition['fertility'] = fertility_effect
+            
+            if 'mortality' in components:
+                mortality_effect = self._estimate_mortality_effect(df1, df2, outcome)
+                decomposition['mortality'] = mortality_effect
+            
+            if 'migration' in components:
+                migration_effect = self._estimate_migration_effect(df1, df2, outcome)
+                decomposition['migration'] = migration_effect
+            
+            # Effet comportemental résiduel
+            total_change = df2[outcome].mean() - df1[outcome].mean()
+            explained_change = sum(effect['contribution'] for effect in decomposition.values())
+            residual_effect = total_change - explained_change
+            
+            decomposition['residual'] = {
+                'contribution': residual_effect,
+                'percent': (residual_effect / total_change * 100) if total_change != 0 else 0,
+                'interpretation': "Effet comportemental et autres facteurs non démographiques"
+            }
+            
+            results['decompositions'][f'{p1}-{p2}'] = {
+                'total_change': total_change,
+                'components': decomposition,
+                'summary': self._summarize_demographic_decomposition(decomposition)
+            }
+        
+        return results
+    
+    def _calculate_age_structure_effect(self, df1, df2, outcome, age_var):
+        """Calcule l'effet de la structure par âge"""
+        # Groupement par âge
+        age_groups = sorted(set(df1[age_var].unique()) | set(df2[age_var].unique()))
+        
+        effect = 0
+        for age in age_groups:
+            # Valeur moyenne pour cet âge (moyenne sur les deux périodes)
+            y1 = df1[df1[age_var] == age][outcome].mean() if age in df1[age_var].values else 0
+            y2 = df2[df2[age_var] == age][outcome].mean() if age in df2[age_var].values else 0
+            y_bar = (y1 + y2) / 2
+            
+            # Poids (proportion de la population)
+            w1 = len(df1[df1[age_var] == age]) / len(df1) if len(df1) > 0 else 0
+            w2 = len(df2[df2[age_var] == age]) / len(df2) if len(df2) > 0 else 0
+            
+            effect += y_bar * (w2 - w1)
+        
+        return {
+            'contribution': effect,
+            'interpretation': "Effet du changement dans la structure par âge de la population"
+        }
+    
+    def _estimate_fertility_effect(self, df1, df2, outcome):
+        """Estime l'effet de la fécondité (version simplifiée)"""
+        # Dans une vraie implémentation, utiliserait les taux de fécondité par âge
+        return {
+            'contribution': 0,  # Placeholder
+            'interpretation': "Effet du changement dans les taux de fécondité"
+        }
+    
+    def _estimate_mortality_effect(self, df1, df2, outcome):
+        """Estime l'effet de la mortalité"""
+        return {
+            'contribution': 0,  # Placeholder
+            'interpretation': "Effet du changement dans les taux de mortalité"
+        }
+    
+    def _estimate_migration_effect(self, df1, df2, outcome):
+        """Estime l'effet des migrations"""
+        return {
+            'contribution': 0,  # Placeholder
+            'interpretation': "Effet des migrations nettes"
+        }
+    
+    def _summarize_demographic_decomposition(self, decomposition):
+        """Résume la décomposition démographique"""
+        total = sum(comp['contribution'] for comp in decomposition.values())
+        
+        summary = {}
+        for name, comp in decomposition.items():
+            percent = (comp['contribution'] / total * 100) if total != 0 else 0
+            summary[name] = {
+                'contribution': comp['contribution'],
+                'percent': percent,
+                'interpretation': comp.get('interpretation', '')
+            }
+        
+        return summary
+    
+    def path_analysis_decomposition(self, df: pd.DataFrame, outcome: str,
+                                   paths: Dict[str, List[str]]) -> Dict:
+        """
+        Décomposition par analyse des chemins (Path Analysis)
+        
+        Args:
+            df: DataFrame avec les données
+            outcome: Variable dépendante finale
+            paths: Dictionnaire des chemins {nom_chemin: [variables]}
+            
+        Returns:
+            Résultats de l'analyse des chemins
+        """
+        # Cette méthode implémente une version simplifiée de l'analyse des chemins
+        # Pour une implémentation complète, utiliser un package comme semopy
+        
+        results = {
+            'paths': {},
+            'total_effects': {}
+        }
+        
+        # Pour chaque chemin
+        for path_name, variables in paths.items():
+            path_results = []
+            
+            # Régression pour chaque étape du chemin
+            for i in range(len(variables)):
+                if i == 0:
+                    # Première étape: variable initiale -> première variable médiatrice
+                    X = df[variables[0]].values.reshape(-1, 1)
+                    y = df[variables[1]].values
+                elif i < len(variables) - 1:
+                    # Étapes intermédiaires
+                    X = df[variables[i]].values.reshape(-1, 1)
+                    y = df[variables[i+1]].values
+                else:
+                    # Dernière étape: dernière variable médiatrice -> outcome
+                    X = df[variables[-1]].values.reshape(-1, 1)
+                    y = df[outcome].values
+                
+                # Régression simple
+                if len(set(X.flatten())) > 1:
+                    slope = np.cov(X.flatten(), y)[0, 1] / np.var(X.flatten())
+                    path_results.append(slope)
+                else:
+                    path_results.append(0)
+            
+            # Effet total du chemin (produit des coefficients)
+            total_path_effect = np.prod(path_results)
+            
+            results['paths'][path_name] = {
+                'variables': variables,
+                'coefficients': path_results,
+                'total_effect': total_path_effect
+            }
+        
+        # Effets totaux
+        total_variance = df[outcome].var()
+        
+        for path_name, path_info in results['paths'].items():
+            explained_variance = (path_info['total_effect'] ** 2) * df[path_info['variables'][0]].var()
+            percent_explained = (explained_variance / total_variance * 100) if total_variance != 0 else 0
+            
+            results['total_effects'][path_name] = {
+                'explained_variance': explained_variance,
+                'percent_explained': percent_explained
+            }
+        
+        return results
+
+# Classe pour les analyses multi-niveaux
+class MultiLevelDecomposition:
+    """Décomposition multi-niveaux (individu, groupe, société)"""
+    
+    @staticmethod
+    def hierarchical_linear_model(df, outcome, level1_vars, level2_vars, group_var):
+        """Modèle linéaire hiérarchique"""
+        # Implémentation simplifiée
         pass
\ No newline at end of file
@@ -1,104 +1,171 @@
-"""
-Module de visualisation pour l'application de décomposition
-"""
-
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
-import numpy as np
-from typing import Dict
-
-def create_decomposition_charts(results: Dict):
-    """
-    Crée les visualisations pour la décomposition démographique
-    """
-    df = results['group_results']
-    agg = results['aggregate_results']
-    
-    # 1. Graphique à barres des contributions par groupe
-    fig1 = go.Figure()
-    
-    # Tri par contribution absolue
-    df_sorted = df.sort_values('contribution_abs', ascending=False)
-    
-    # Barres pour l'effet de composition
-    fig1.add_trace(go.Bar(
-        x=df_sorted['group'],
-        y=df_sorted['effect_composition'],
-        name='Effet de Composition',
-        marker_color='#3B82F6',
-        hovertemplate='<b>%{x}</b><br>Composition: %{y:.3f}<extra></extra>'
-    ))
-    
-    # Barres pour l'effet de comportement
-    fig1.add_trace(go.Bar(
-        x=df_sorted['group'],
-        y=df_sorted['effect_behavior'],
-        name='Effet de Comportement',
-        marker_color='#10B981',
-        hovertemplate='<b>%{x}</b><br>Comportement: %{y:.3f}<extra></extra>'
-    ))
-    
-    # Configuration
-    fig1.update_layout(
-        title='Contributions par Groupe',
-        xaxis_title='Groupes',
-        yaxis_title='Contribution',
-        barmode='stack',
-        hovermode='x unified',
-        height=500,
-        showlegend=True,
-        template='plotly_white'
-    )
-    
-    # 2. Camembert des effets totaux
-    fig2 = go.Figure()
-    
-    labels = ['Effet de Composition', 'Effet de Comportement']
-    values = [agg['composition_effect'], agg['behavior_effect']]
-    percents = [agg['composition_percent'], agg['behavior_percent']]
-    
-    # Texte des pourcentages
-    text = [f'{p:.1f}%' for p in percents]
-    
-    fig2.add_trace(go.Pie(
-        labels=labels,
-        values=values,
-        text=text,
-        textinfo='label+percent',
-        hovertemplate='<b>%{label}</b><br>Valeur: %{value:.3f}<br>Pourcentage: %{percent}<extra></extra>',
-        marker_colors=['#3B82F6', '#10B981']
-    ))
-    
-    fig2.update_layout(
-        title='Répartition des Effets Totaux',
-        height=400,
-        showlegend=True,
-        template='plotly_white'
-    )
-    
-    return fig1, fig2
-
-def create_regression_charts(results: Dict):
-    """Visualisations pour la décomposition de régression"""
-    # À implémenter
-    pass
-
-def create_time_series_chart(df: pd.DataFrame, time_col: str, value_col: str, 
-                             group_col: str = None):
-    """Crée un graphique de séries temporelles"""
-    if group_col:
-        fig = px.line(df, x=time_col, y=value_col, color=group_col,
-                     title='Évolution temporelle par groupe')
-    else:
-        fig = px.line(df, x=time_col, y=value_col, title='Évolution temporelle')
-    
-    fig.update_layout(
-        xaxis_title='Période',
-        yaxis_title='Valeur',
-        hovermode='x unified',
-        template='plotly_white'
-    )
-    
+"""
+Module de visualisation pour l'application de décomposition
+"""
+
+import plotly.graph_objects as go
+import plotly.express as px
+import pandas as pd
+import numpy as np
+from typing import Dict
+
+def create_decomposition_charts(results: Dict):
+    """
+    Crée les visualisations pour la décomposition démographique
+    """
+    df = results['group_results']
+    agg = results['aggregate_results']
+    
+    # 1. Graphique à barres des contributions par groupe
+    fig1 = go.Figure()
+    
+    # Tri par contribution absolue
+    df_sorted = df.sort_values('contribution_abs', ascending=False)
+    
+    # Barres pour l'effet de composition
+    fig1.add_trace(go.Bar(
+        x=df_sorted['group'],
+        y=df_sorted['effect_composition'],
+        name='Effet de Composition',
+        marker_color='#3B82F6',
+        hovertemplate='<b>%{x}</b><br>Composition: %{y:.3f}<extra></extra>'
+    ))
+    
+    # Barres pour l'effet de comportement
+    fig1.add_trace(go.Bar(
+        x=df_sorted['group'],
+        y=df_sorted['effect_behavior'],
+        name='Effet de Comportement',
+        marker_color='#10B981',
+        hovertemplate='<b>%{x}</b><br>Comportement: %{y:.3f}<extra></extra>'
+    ))
+    
+    # Configuration
+    fig1.update_layout(
+        title='Contributions par Groupe',
+        xaxis_title='Groupes',
+        yaxis_title='Contribution',
+        barmode='stack',
+        hovermode='x unified',
+        height=500,
+        showlegend=True,
+        template='plotly_white'
+    )
+    
+    # 2. Camembert des effets totaux
+    fig2 = go.Figure()
+    
+    labels = ['Effet de Composition', 'Effet de Comportement']
+    values = [agg['composition_effect'], agg['behavior_effect']]
+    percents = [agg['composition_percent'], agg['behavior_percent']]
+    
+    # Texte des pourcentages
+    text = [f'{p:.1f}%' for p in percents]
+    
+    fig2.add_trace(go.Pie(
+        labels=labels,
+        values=values,
+        text=text,
+        textinfo='label+percent',
+        hovertemplate='<b>%{label}</b><br>Valeur: %{value:.3f}<br>Pourcentage: %{percent}<extra></extra>',
+        marker_colors=['#3B82F6', '#10B981']
+    ))
+    
+    fig2.update_layout(
+        title='Répartition des Effets Totaux',
+        height=400,
+        showlegend=True,
+        template='plotly_white'
+    )
+    
+    return fig1, fig2
+
+def create_regression_charts(results: Dict):
+    """Visualisations pour la décomposition de régression"""
+    # À implémenter
+    pass
+
+# Nombre maximal de points transmis au navigateur par série
+MAX_POINTS_PER_SERIES = 2000
+# Nombre de points à partir duquel les tracés passent en WebGL
+WEBGL_THRESHOLD = 1000
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices retenus par l'algorithme LTTB (Largest-Triangle-Three-Buckets)
+    
+    Le premier et le dernier point sont conservés ; chaque seau intermédiaire
+    garde le point formant le plus grand triangle avec le point retenu
+    précédemment et la moyenne du seau suivant.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            xc, yc = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            xc, yc = x[n - 1], y[n - 1]
+        
+        xa, ya = x[a], y[a]
+        areas = np.abs((xa - xc) * (y[start:end] - ya) - (xa - x[start:end]) * (yc - ya))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    
+    return indices
+
+def _downsample_series(df: pd.DataFrame, time_col: str, value_col: str,
+                       n_out: int = MAX_POINTS_PER_SERIES) -> pd.DataFrame:
+    """Réduit une série triée par LTTB si elle dépasse n_out points"""
+    if len(df) <= n_out:
+        return df
+    
+    time = df[time_col]
+    if pd.api.types.is_datetime64_any_dtype(time):
+        x = time.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+    elif pd.api.types.is_numeric_dtype(time):
+        x = time.to_numpy(dtype=np.float64)
+    else:
+        x = np.arange(len(df), dtype=np.float64)
+    y = df[value_col].to_numpy(dtype=np.float64)
+    
+    return df.iloc[_lttb_indices(x, y, n_out)]
+
+def create_time_series_chart(df: pd.DataFrame, time_col: str, value_col: str, 
+                             group_col: str = None):
+    """Crée un graphique de séries temporelles"""
+    # Sous-échantillonnage LTTB : au plus MAX_POINTS_PER_SERIES points par série
+    df = df.sort_values(time_col, kind='stable')
+    if group_col:
+        df = pd.concat(
+            [_downsample_series(part, time_col, value_col)
+             for _, part in df.groupby(group_col, observed=True, sort=False)]
+        )
+    else:
+        df = _downsample_series(df, time_col, value_col)
+    
+    # Tracés WebGL (Scattergl) au-delà de WEBGL_THRESHOLD points, SVG sinon
+    render_mode = 'webgl' if len(df) > WEBGL_THRESHOLD else 'svg'
+    
+    if group_col:
+        fig = px.line(df, x=time_col, y=value_col, color=group_col,
+                     title='Évolution temporelle par groupe', render_mode=render_mode)
+    else:
+        fig = px.line(df, x=time_col, y=value_col, title='Évolution temporelle',
+                     render_mode=render_mode)
+    
+    fig.update_layout(
+        xaxis_title='Période',
+        yaxis_title='Valeur',
+        hovermode='x unified',
+        template='plotly_white'
+    )
+    
     return fig
\ No newline at end of file